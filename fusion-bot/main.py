@@ -23,45 +23,46 @@ Usage:
 """
 
 import argparse
+import math
 import os
 import signal
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.live import Live
 from rich.table import Table
+from rich.text import Text
 
 from src.config import get_settings
 from src.config.settings import Settings
 from src.utils.logging import setup_logging, get_logger
-from src.infrastructure.database import get_db_manager
-from src.infrastructure.exchange import BinanceClient, PaperExchange
-from src.strategies import FusionStrategy
 
-console = Console()
+# Heavy modules (database, exchange, strategy -> sqlalchemy, ccxt, pandas)
+# are imported inside the commands that need them, so `--help` stays fast.
+
+# Under docker/systemd stdout is a pipe: skip colour and markup work there
+_IS_TTY = sys.stdout.isatty()
+console = Console(no_color=not _IS_TTY)
 logger = None  # Initialized after logging setup
 
-# Global flag for graceful shutdown
-shutdown_requested = False
+# Set by the signal handler to wake the main loop for graceful shutdown
+shutdown_event = threading.Event()
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
-    global shutdown_requested
-    if shutdown_requested:
+    if shutdown_event.is_set():
         console.print("\n[red]Force exit![/red]")
         sys.exit(1)
     console.print("\n[yellow]Shutdown requested. Finishing current cycle...[/yellow]")
-    shutdown_requested = True
+    shutdown_event.set()
 
 
-def create_status_table(strategy: FusionStrategy) -> Table:
-    """Create a status table for display."""
-    status = strategy.get_status()
-    
+def create_status_table(status: dict) -> Table:
+    """Create a status table from a strategy.get_status() result."""
     table = Table(title="FusionBot Status", show_header=True)
     table.add_column("Component", style="cyan")
     table.add_column("Status", style="green")
@@ -84,12 +85,14 @@ def run_bot(settings: Settings, verbose: bool = False):
         settings: Application settings
         verbose: Enable verbose output
     """
-    global shutdown_requested
+    from src.infrastructure.database import get_db_manager
+    from src.infrastructure.exchange import BinanceClient, PaperExchange
+    from src.strategies import FusionStrategy
     
     console.print(Panel.fit(
         "[bold white]FusionBot[/bold white] - AI-Powered Crypto Trading\n"
         f"Mode: [yellow]{settings.trading_mode.upper()}[/yellow]\n"
-        f"Watchlist: [cyan]{settings.watchlist}[/cyan]",
+        f"Watchlist: [cyan]{','.join(settings.watchlist)}[/cyan]",
         title="🤖 Starting",
         border_style="blue",
     ))
@@ -137,31 +140,29 @@ def run_bot(settings: Settings, verbose: bool = False):
     interval = settings.main_loop_interval_seconds
     
     try:
-        while not shutdown_requested:
-            cycle_start = time.time()
+        while not shutdown_event.is_set():
+            cycle_start_ns = time.monotonic_ns()
             
             # Run strategy cycle
             results = strategy.run_cycle()
             
             if verbose:
-                console.print(
-                    f"[dim]Cycle {results['cycle']}:[/dim] "
+                summary = (
                     f"Mode={results['mode']}, "
                     f"Positions={results['positions_checked']}, "
                     f"Trades={results['trades_opened']}, "
                     f"Duration={results['duration_ms']}ms"
                 )
+                if _IS_TTY:
+                    console.print(f"[dim]Cycle {results['cycle']}:[/dim] {summary}")
+                else:
+                    print(f"Cycle {results['cycle']}: {summary}", flush=True)
             
-            # Sleep until next cycle
-            elapsed = time.time() - cycle_start
-            sleep_time = max(0, interval - elapsed)
-            
-            if sleep_time > 0 and not shutdown_requested:
-                # Sleep in small increments to respond to shutdown quickly
-                for _ in range(int(sleep_time)):
-                    if shutdown_requested:
-                        break
-                    time.sleep(1)
+            # Sleep until next cycle (wakes immediately on shutdown signal)
+            # Monotonic clock so NTP/wall-clock jumps can't skew the interval
+            elapsed = (time.monotonic_ns() - cycle_start_ns) / 1e9
+            if shutdown_event.wait(timeout=max(0.0, interval - elapsed)):
+                break
     
     except KeyboardInterrupt:
         pass
@@ -176,6 +177,11 @@ def run_bot(settings: Settings, verbose: bool = False):
 
 def show_status(settings: Settings):
     """Show current bot status."""
+    from src.infrastructure.database import get_db_manager
+    from src.infrastructure.exchange import BinanceClient, PaperExchange
+    from src.strategies import FusionStrategy
+    from src.utils.helpers import calculate_pnl_percents
+    
     console.print("Fetching status...\n")
     
     try:
@@ -190,14 +196,14 @@ def show_status(settings: Settings):
         strategy = FusionStrategy(exchange)
         
         # Display status
-        table = create_status_table(strategy)
+        table = create_status_table(strategy.get_status())
         console.print(table)
         
         # Show positions
         positions = strategy.position_manager.get_open_positions()
         if positions:
             console.print("\n[bold]Open Positions:[/bold]")
-            pos_table = Table()
+            pos_table = Table(highlight=False)
             pos_table.add_column("ID")
             pos_table.add_column("Symbol")
             pos_table.add_column("Entry")
@@ -205,21 +211,34 @@ def show_status(settings: Settings):
             pos_table.add_column("P&L")
             pos_table.add_column("Age")
             
-            for pos in positions:
-                try:
-                    ticker = exchange.get_ticker(pos.symbol)
-                    current = ticker.last
-                    pnl = (current - pos.entry_price) / pos.entry_price
-                    pnl_str = f"[{'green' if pnl > 0 else 'red'}]{pnl:+.2%}[/]"
-                except:
-                    current = "N/A"
+            # One batched ticker request, then all P&L in one vectorized pass
+            try:
+                tickers = exchange.get_tickers(list({pos.symbol for pos in positions}))
+            except Exception:
+                tickers = {}
+            current_prices = [
+                tickers[pos.symbol].last if pos.symbol in tickers else math.nan
+                for pos in positions
+            ]
+            
+            pnls = calculate_pnl_percents(
+                [pos.entry_price for pos in positions],
+                current_prices,
+            )
+            
+            for pos, current, pnl in zip(positions, current_prices, pnls):
+                if math.isnan(current):
+                    current_str = "N/A"
                     pnl_str = "N/A"
+                else:
+                    current_str = f"${current:,.2f}"
+                    pnl_str = Text(f"{pnl:+.2%}", style="green" if pnl > 0 else "red")
                 
                 pos_table.add_row(
                     str(pos.id),
                     pos.symbol,
                     f"${pos.entry_price:,.2f}",
-                    f"${current:,.2f}" if isinstance(current, float) else current,
+                    current_str,
                     pnl_str,
                     f"{pos.age_hours:.1f}h",
                 )
@@ -243,6 +262,10 @@ def close_all_positions(settings: Settings):
         console.print("Cancelled.")
         return
     
+    from src.infrastructure.database import get_db_manager
+    from src.infrastructure.exchange import BinanceClient, PaperExchange
+    from src.strategies import FusionStrategy
+    
     try:
         db = get_db_manager()
         
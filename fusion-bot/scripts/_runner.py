@@ -0,0 +1,64 @@
+"""
+Concurrent Section Runner for Scripts
+=====================================
+
+Shared by the scripts in this directory: runs independent, I/O-bound
+sections in worker threads and prints each section's output in order.
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from rich.console import Console
+
+
+def buffered_console(console: Console) -> Console:
+    """Create a console that renders like `console`, but into memory."""
+    return Console(
+        file=io.StringIO(),
+        width=console.width,
+        force_terminal=console.is_terminal,
+        color_system=console.color_system,
+    )
+
+
+def run_concurrently(
+    tasks: Dict[str, Callable[..., Any]],
+    console: Console,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run independent tasks in parallel, printing their output in order.
+    
+    Each task is called as `task(out=buffer)` with its own buffered
+    console, so sections don't interleave; the buffers are written to
+    `console` in the order of `tasks` once every task has finished.
+    
+    Args:
+        tasks: Dict of section name to callable accepting an `out` console
+        console: Console the buffered output is written to
+        max_workers: Cap on tasks running at once (default: one per task)
+    
+    Returns:
+        Dict of section name to the task's return value, or False if it raised
+    """
+    outputs = {name: buffered_console(console) for name in tasks}
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks) or 1) as executor:
+        futures = {
+            name: executor.submit(task, out=outputs[name])
+            for name, task in tasks.items()
+        }
+    
+    results = {}
+    for name, future in futures.items():
+        out = outputs[name]
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            out.print(f"[red]❌ {name} raised: {e}[/red]")
+            results[name] = False
+        console.file.write(out.file.getvalue())
+    console.file.flush()
+    
+    return results
@@ -6,56 +6,157 @@ Check Binance Testnet Transaction History
 Quick script to investigate order history and trades.
 """
 
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-import ccxt
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 from rich import box
 
 # Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
 from src.config import get_settings
+from src.config.settings import Settings
+from scripts._runner import run_concurrently
+
+if TYPE_CHECKING:
+    import ccxt  # Imported in main() only once API keys are confirmed
 
 console = Console()
 
+# Binance requires a symbol for order/trade history, so check the common pairs
+SYMBOLS_TO_CHECK = ["BTC/USDC", "ETH/USDC", "SOL/USDC"]
+
+# Market metadata rarely changes, so keep it on disk between runs
+MARKETS_CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache")
+MARKETS_CACHE_TTL_SECONDS = 24 * 3600
+
+# Rich style per ccxt order status
+_STATUS_STYLE = {
+    "closed": "green",
+    "filled": "green",
+    "open": "yellow",
+    "canceled": "red",
+    "cancelled": "red",
+}
+
 
+_UTC = timezone.utc
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+
+@lru_cache(maxsize=4096)
 def format_timestamp(ts: Optional[int]) -> str:
-    """Format timestamp to readable date."""
+    """Format a Binance millisecond timestamp to a readable date."""
     if not ts:
         return "N/A"
-    return datetime.fromtimestamp(ts / 1000, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    return datetime.fromtimestamp(ts * 0.001, _UTC).strftime(_TIMESTAMP_FORMAT)
+
+
+def load_markets_cached(exchange: "ccxt.binance", testnet: bool, ttl: int = MARKETS_CACHE_TTL_SECONDS) -> None:
+    """
+    Load exchange markets, reusing a local copy if it is fresh.
+    
+    load_markets() downloads the full exchangeInfo payload on every call,
+    which dominates startup for this script. The cache file is keyed by
+    network so testnet and mainnet markets never mix.
+    """
+    network = "testnet" if testnet else "mainnet"
+    path = os.path.join(MARKETS_CACHE_DIR, f"binance_markets_{network}.json")
+    
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding="utf-8") as f:
+                exchange.set_markets(json.load(f))
+            return
+    except (OSError, ValueError):
+        pass  # Missing or corrupt cache - fall through to a fresh load
+    
+    markets = exchange.load_markets()
+    try:
+        os.makedirs(MARKETS_CACHE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(markets, f)
+    except (OSError, TypeError):
+        pass  # Caching is best-effort
+
+
+def use_fast_json(exchange: "ccxt.binance") -> None:
+    """
+    Decode exchange responses with orjson when it is installed.
+    
+    Order and trade history payloads are large and JSON decoding is a
+    noticeable share of this script's CPU time. Numbers come back as
+    floats instead of ccxt's precision-preserving strings, which is fine
+    for display. Falls back to ccxt's own parser on anything orjson rejects.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return
+    
+    default_parse_json = exchange.parse_json
+    
+    def parse_json(http_response):
+        try:
+            return orjson.loads(http_response)
+        except orjson.JSONDecodeError:
+            return default_parse_json(http_response)
+    
+    exchange.parse_json = parse_json
+
+
+def fetch_for_symbols(fetch: Callable, symbols: List[str], **kwargs) -> List[dict]:
+    """
+    Run a per-symbol ccxt fetch for several symbols in parallel.
+    
+    Each call is a separate HTTP round-trip, so running them concurrently
+    costs roughly one round-trip instead of one per symbol. Symbols that
+    fail are skipped.
+    
+    The ccxt client is shared by the worker threads and its sync throttle
+    is not thread-safe, so these requests go out as a burst rather than
+    spaced by enableRateLimit. With main() running the checks concurrently
+    that is at most ~10 requests (3 symbols x 3 history checks + balance),
+    far below Binance's per-minute request weight limit.
+    """
+    results = []
+    with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+        futures = [executor.submit(fetch, sym, **kwargs) for sym in symbols]
+        for future in as_completed(futures):
+            try:
+                results.extend(future.result() or [])
+            except Exception:
+                continue
+    return results
 
 
-def check_order_history(exchange: ccxt.binance, symbol: str = None, limit: int = 50):
+def check_order_history(exchange: "ccxt.binance", symbol: str = None, limit: int = 50, out: Console = console):
     """Check order history."""
-    console.print(f"\n[bold cyan]📋 Order History (last {limit})[/bold cyan]")
+    out.print(f"\n[bold cyan]📋 Order History (last {limit})[/bold cyan]")
     
     try:
         # Binance requires symbol for fetch_orders
         if not symbol:
-            # Check common symbols
-            symbols_to_check = ["BTC/USDC", "ETH/USDC", "SOL/USDC"]
-            all_orders = []
-            for sym in symbols_to_check:
-                try:
-                    orders = exchange.fetch_orders(sym, limit=limit)
-                    all_orders.extend(orders)
-                except Exception:
-                    continue
+            all_orders = fetch_for_symbols(exchange.fetch_orders, SYMBOLS_TO_CHECK, limit=limit)
             orders = sorted(all_orders, key=lambda x: x.get("timestamp", 0), reverse=True)[:limit]
         else:
             orders = exchange.fetch_orders(symbol, limit=limit)
         
         if not orders:
-            console.print("[yellow]No orders found[/yellow]")
+            out.print("[yellow]No orders found[/yellow]")
             return
         
-        table = Table(box=box.ROUNDED)
+        table = Table(box=box.ROUNDED, highlight=False)
         table.add_column("Order ID", style="cyan")
         table.add_column("Symbol", style="magenta")
         table.add_column("Side", style="green")
@@ -67,57 +168,42 @@ def check_order_history(exchange: ccxt.binance, symbol: str = None, limit: int =
         
         for order in orders:
             status = order.get("status", "unknown")
-            status_style = {
-                "closed": "green",
-                "filled": "green",
-                "open": "yellow",
-                "canceled": "red",
-                "cancelled": "red",
-            }.get(status, "white")
+            status_style = _STATUS_STYLE.get(status, "white")
             
             table.add_row(
                 str(order.get("id", "N/A")),
                 order.get("symbol", "N/A"),
                 order.get("side", "N/A").upper(),
                 order.get("type", "N/A"),
-                f"[{status_style}]{status}[/{status_style}]",
+                Text(status, style=status_style),
                 f"{order.get('price', 0):,.2f}" if order.get("price") else "Market",
                 f"{order.get('filled', 0):.6f}",
                 format_timestamp(order.get("timestamp")),
             )
         
-        console.print(table)
+        out.print(table)
         
     except Exception as e:
-        console.print(f"[red]Error fetching orders: {e}[/red]")
+        out.print(f"[red]Error fetching orders: {e}[/red]")
 
 
-def check_trade_history(exchange: ccxt.binance, symbol: str = None, limit: int = 50):
+def check_trade_history(exchange: "ccxt.binance", symbol: str = None, limit: int = 50, out: Console = console):
     """Check trade history (filled orders)."""
-    console.print(f"\n[bold cyan]💰 Trade History (last {limit})[/bold cyan]")
+    out.print(f"\n[bold cyan]💰 Trade History (last {limit})[/bold cyan]")
     
     try:
         # Binance requires symbol for fetch_my_trades
         if not symbol:
-            # Check common symbols
-            symbols_to_check = ["BTC/USDC", "ETH/USDC", "SOL/USDC"]
-            all_trades = []
-            for sym in symbols_to_check:
-                try:
-                    trades = exchange.fetch_my_trades(sym, limit=limit)
-                    if trades:
-                        all_trades.extend(trades)
-                except Exception:
-                    continue
+            all_trades = fetch_for_symbols(exchange.fetch_my_trades, SYMBOLS_TO_CHECK, limit=limit)
             trades = sorted(all_trades, key=lambda x: x.get("timestamp", 0), reverse=True)[:limit] if all_trades else []
         else:
             trades = exchange.fetch_my_trades(symbol, limit=limit) or []
         
         if not trades:
-            console.print("[yellow]No trades found[/yellow]")
+            out.print("[yellow]No trades found[/yellow]")
             return
         
-        table = Table(box=box.ROUNDED)
+        table = Table(box=box.ROUNDED, highlight=False)
         table.add_column("Trade ID", style="cyan")
         table.add_column("Order ID", style="dim")
         table.add_column("Symbol", style="magenta")
@@ -142,13 +228,13 @@ def check_trade_history(exchange: ccxt.binance, symbol: str = None, limit: int =
                 format_timestamp(trade.get("timestamp")),
             )
         
-        console.print(table)
+        out.print(table)
         
     except Exception as e:
-        console.print(f"[red]Error fetching trades: {e}[/red]")
+        out.print(f"[red]Error fetching trades: {e}[/red]")
 
 
-def check_specific_order(exchange: ccxt.binance, order_id: str, symbol: str):
+def check_specific_order(exchange: "ccxt.binance", order_id: str, symbol: str):
     """Check specific order details."""
     console.print(f"\n[bold cyan]🔍 Order Details: {order_id}[/bold cyan]")
     
@@ -176,36 +262,21 @@ def check_specific_order(exchange: ccxt.binance, order_id: str, symbol: str):
         console.print(f"[red]Error fetching order: {e}[/red]")
 
 
-def check_open_orders(exchange: ccxt.binance, symbol: str = None):
+def check_open_orders(exchange: "ccxt.binance", symbol: str = None, out: Console = console):
     """Check open orders."""
-    console.print(f"\n[bold cyan]📊 Open Orders[/bold cyan]")
+    out.print(f"\n[bold cyan]📊 Open Orders[/bold cyan]")
     
     try:
-        # Suppress warning for fetch_open_orders without symbol
-        if not hasattr(exchange, "_suppressed_warning"):
-            exchange.options["warnOnFetchOpenOrdersWithoutSymbol"] = False
-            exchange._suppressed_warning = True
-        
         if symbol:
             orders = exchange.fetch_open_orders(symbol)
         else:
-            # Check common symbols
-            symbols_to_check = ["BTC/USDC", "ETH/USDC", "SOL/USDC"]
-            all_orders = []
-            for sym in symbols_to_check:
-                try:
-                    orders = exchange.fetch_open_orders(sym)
-                    if orders:
-                        all_orders.extend(orders)
-                except Exception:
-                    continue
-            orders = all_orders
+            orders = fetch_for_symbols(exchange.fetch_open_orders, SYMBOLS_TO_CHECK)
         
         if not orders:
-            console.print("[green]No open orders[/green]")
+            out.print("[green]No open orders[/green]")
             return
         
-        table = Table(box=box.ROUNDED)
+        table = Table(box=box.ROUNDED, highlight=False)
         table.add_column("Order ID", style="cyan")
         table.add_column("Symbol", style="magenta")
         table.add_column("Side", style="green")
@@ -227,22 +298,27 @@ def check_open_orders(exchange: ccxt.binance, symbol: str = None):
                 format_timestamp(order.get("timestamp")),
             )
         
-        console.print(table)
+        out.print(table)
         
     except Exception as e:
-        console.print(f"[red]Error fetching open orders: {e}[/red]")
+        out.print(f"[red]Error fetching open orders: {e}[/red]")
+
+
+# Handlers for the common balance value types, keyed on exact type
+_BALANCE_VALUE_HANDLERS = {
+    dict: lambda v: float(v.get("total", 0) or 0),
+    float: float,
+    int: float,
+    bool: float,
+    type(None): lambda v: 0,
+}
 
 
 def _safe_get_balance_value(value):
     """Safely extract numeric balance value from various formats."""
-    if value is None:
-        return 0
-    
-    if isinstance(value, dict):
-        return float(value.get("total", 0) or 0)
-    
-    if isinstance(value, (int, float)):
-        return float(value)
+    handler = _BALANCE_VALUE_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
     
     # Skip strings (likely timestamps or metadata)
     if isinstance(value, str):
@@ -254,68 +330,74 @@ def _safe_get_balance_value(value):
         except (ValueError, TypeError):
             return 0
     
+    # Subclasses of the handled types (e.g. OrderedDict)
+    if isinstance(value, dict):
+        return float(value.get("total", 0) or 0)
+    if isinstance(value, (int, float)):
+        return float(value)
+    
     return 0
 
 
-def check_balances(exchange: ccxt.binance):
+def _format_amount(value: float) -> str:
+    """Format a balance amount with up to 8 decimals, trailing zeros removed."""
+    return f"{value:.8f}".rstrip("0").rstrip(".")
+
+
+def _balance_row(currency: str, curr_bal) -> tuple:
+    """Build a (currency, free, used, total) table row from a ccxt balance entry."""
+    # Handle both dict structure and direct value
+    if isinstance(curr_bal, dict):
+        free = float(curr_bal.get("free", 0) or 0)
+        used = float(curr_bal.get("used", 0) or 0)
+        total = float(curr_bal.get("total", 0) or 0)
+    else:
+        # If it's a direct value, treat as total
+        total = _safe_get_balance_value(curr_bal)
+        free = total
+        used = 0
+    return currency, _format_amount(free), _format_amount(used), _format_amount(total)
+
+
+def check_balances(exchange: "ccxt.binance", settings: Settings, out: Console = console):
     """Check current account balances."""
-    console.print(f"\n[bold cyan]💰 Account Balances[/bold cyan]")
+    out.print(f"\n[bold cyan]💰 Account Balances[/bold cyan]")
     
     try:
         balance = exchange.fetch_balance()
-        settings = get_settings()
         
-        # Get watchlist base currencies (e.g., "BTC/USDC" -> "BTC")
-        watchlist_symbols = settings.watchlist_symbols
-        watchlist_currencies = set()
-        for symbol in watchlist_symbols:
-            base = symbol.split("/")[0]
-            watchlist_currencies.add(base)
+        # Split watchlist symbols once (e.g., "BTC/USDC" -> "BTC"), reused below
+        bases = [(symbol, symbol.partition("/")[0]) for symbol in settings.watchlist]
         
         # Only show USDC and watchlist currencies
-        currencies_to_show = ["USDC"] + sorted(watchlist_currencies)
+        currencies_to_show = ["USDC"] + sorted({base for _, base in bases})
         
-        table = Table(box=box.ROUNDED)
+        table = Table(box=box.ROUNDED, highlight=False)
         table.add_column("Currency", style="cyan")
         table.add_column("Free", style="green")
         table.add_column("Used", style="yellow")
         table.add_column("Total", style="white")
         
-        for currency in currencies_to_show:
-            if currency in balance:
-                curr_bal = balance[currency]
-                
-                # Handle both dict structure and direct value
-                if isinstance(curr_bal, dict):
-                    free = float(curr_bal.get("free", 0) or 0)
-                    used = float(curr_bal.get("used", 0) or 0)
-                    total = float(curr_bal.get("total", 0) or 0)
-                else:
-                    # If it's a direct value, treat as total
-                    total = _safe_get_balance_value(curr_bal)
-                    free = total
-                    used = 0
-                
-                # Always show USDC and watchlist currencies, even if 0
-                table.add_row(
-                    currency,
-                    f"{free:.8f}".rstrip("0").rstrip("."),
-                    f"{used:.8f}".rstrip("0").rstrip("."),
-                    f"{total:.8f}".rstrip("0").rstrip("."),
-                )
+        # Always show USDC and watchlist currencies, even if 0
+        rows = [
+            _balance_row(currency, balance[currency])
+            for currency in currencies_to_show
+            if currency in balance
+        ]
+        for row in rows:
+            table.add_row(*row)
         
-        console.print(table)
+        out.print(table)
         
         # Also show position check for watchlist symbols
-        console.print(f"\n[bold cyan]📊 Position Check (get_position)[/bold cyan]")
+        out.print(f"\n[bold cyan]📊 Position Check (get_position)[/bold cyan]")
         position_table = Table(box=box.ROUNDED)
         position_table.add_column("Symbol", style="magenta")
         position_table.add_column("Position Size", style="white")
         position_table.add_column("Balance Check", style="dim")
         
-        for symbol in watchlist_symbols:
+        for symbol, base in bases:
             try:
-                base = symbol.split("/")[0]
                 base_balance = balance.get(base)
                 total_balance = _safe_get_balance_value(base_balance)
                 
@@ -324,16 +406,16 @@ def check_balances(exchange: ccxt.binance):
                 
                 position_table.add_row(
                     symbol,
-                    f"{position_size:.8f}".rstrip("0").rstrip(".") if position_size else "[red]None[/red]",
-                    f"Balance: {total_balance:.8f}".rstrip("0").rstrip(".") if total_balance > 0 else "[red]0[/red]",
+                    _format_amount(position_size) if position_size else "[red]None[/red]",
+                    f"Balance: {_format_amount(total_balance)}" if total_balance > 0 else "[red]0[/red]",
                 )
             except Exception as e:
                 position_table.add_row(symbol, "[red]Error[/red]", str(e)[:50])
         
-        console.print(position_table)
+        out.print(position_table)
         
     except Exception as e:
-        console.print(f"[red]Error fetching balances: {e}[/red]")
+        out.print(f"[red]Error fetching balances: {e}[/red]")
 
 
 def main():
@@ -345,19 +427,25 @@ def main():
         console.print("Set BINANCE_API_KEY and BINANCE_API_SECRET in your .env file")
         return
     
+    import ccxt
+    
     # Initialize exchange
     exchange_config = {
         "apiKey": settings.binance_api_key,
         "secret": settings.binance_api_secret,
         "sandbox": settings.binance_testnet,
         "enableRateLimit": True,
-        "options": {"defaultType": "spot"},
+        "options": {
+            "defaultType": "spot",
+            "warnOnFetchOpenOrdersWithoutSymbol": False,
+        },
     }
     
     exchange = ccxt.binance(exchange_config)
+    use_fast_json(exchange)
     
     try:
-        exchange.load_markets()
+        load_markets_cached(exchange, settings.binance_testnet)
         console.print(f"[green]✓ Connected to Binance {'Testnet' if settings.binance_testnet else 'Mainnet'}[/green]")
     except Exception as e:
         console.print(f"[red]Failed to connect: {e}[/red]")
@@ -372,10 +460,13 @@ def main():
         return
     
     # Show all history
-    check_balances(exchange)
-    check_open_orders(exchange)
-    check_order_history(exchange, limit=20)
-    check_trade_history(exchange, limit=20)
+    # Each check waits on its own Binance requests, so overlap them
+    run_concurrently({
+        "Balances": partial(check_balances, exchange, settings),
+        "Open Orders": partial(check_open_orders, exchange),
+        "Order History": partial(check_order_history, exchange, limit=20),
+        "Trade History": partial(check_trade_history, exchange, limit=20),
+    }, console)
     
     console.print("\n[bold]💡 Tips:[/bold]")
     console.print("  - Check specific order: python scripts/check_binance_history.py <order_id> <symbol>")
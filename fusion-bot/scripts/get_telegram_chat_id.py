@@ -12,11 +12,48 @@ Usage:
 
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.panel import Panel
 
+try:
+    import orjson as _json  # Optional: faster decoding of large getUpdates payloads
+except ImportError:
+    import json as _json
+
 console = Console()
 
+# Shared keep-alive session so repeated getUpdates calls reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_SESSION.headers.update({"Connection": "keep-alive"})
+
+
+# getUpdates returns at most 100 updates per call; cap the body we'll buffer
+GET_UPDATES_LIMIT = 100
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+
+def _read_capped(response: requests.Response, max_bytes: int = MAX_RESPONSE_BYTES) -> bytes:
+    """Read a streamed response body, refusing bodies larger than max_bytes."""
+    declared = response.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise ValueError(f"Response too large ({declared} bytes, limit {max_bytes})")
+    
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        size += len(chunk)
+        if size > max_bytes:
+            raise ValueError(f"Response too large (over {max_bytes} bytes)")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def close() -> None:
+    """Close the shared HTTP session."""
+    _SESSION.close()
+
 
 def get_chat_id(bot_token: str):
     """Get chat ID from Telegram bot updates."""
@@ -24,10 +61,14 @@ def get_chat_id(bot_token: str):
     
     try:
         console.print("[cyan]Fetching updates from Telegram...[/cyan]")
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        with _SESSION.get(
+            url,
+            params={"limit": GET_UPDATES_LIMIT},
+            timeout=10,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            data = _json.loads(_read_capped(response))
         
         if not data.get("ok"):
             error = data.get("description", "Unknown error")
@@ -47,14 +88,12 @@ def get_chat_id(bot_token: str):
             return None
         
         # Get all unique chat IDs from updates
-        chat_ids = set()
-        for update in updates:
-            if "message" in update:
-                chat = update["message"].get("chat", {})
-                chat_id = chat.get("id")
-                chat_type = chat.get("type", "unknown")
-                if chat_id:
-                    chat_ids.add((chat_id, chat_type))
+        chats = (update["message"].get("chat", {}) for update in updates if "message" in update)
+        chat_ids = frozenset(
+            (chat["id"], chat.get("type", "unknown"))
+            for chat in chats
+            if chat.get("id")
+        )
         
         if not chat_ids:
             console.print("[red]❌ No chat IDs found in updates[/red]")
@@ -114,7 +153,10 @@ def main():
     console.print(f"\n[cyan]Using bot token: {bot_token[:10]}...{bot_token[-5:]}[/cyan]\n")
     
     # Get chat ID
-    chat_id = get_chat_id(bot_token)
+    try:
+        chat_id = get_chat_id(bot_token)
+    finally:
+        close()
     
     if chat_id:
         console.print("\n" + "=" * 60)
@@ -12,42 +12,75 @@ Usage:
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from datetime import datetime
+from datetime import datetime, timezone
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich import print as rprint
+
+from scripts._runner import run_concurrently
 
 console = Console()
 
 
-def test_rss_feeds():
+def _fetch_all_feeds(client, feeds) -> dict:
+    """
+    Fetch every feed concurrently, one worker thread per feed.
+    
+    Args:
+        client: RSSClient used for the requests (its requests.Session is
+            shared across the worker threads)
+        feeds: Dict of source name to feed URL
+        
+    Returns:
+        Dict of source name to its item list, or the exception it raised
+    """
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=len(feeds)) as executor:
+        futures = {
+            executor.submit(client.fetch_crypto_news, {source: url}): source
+            for source, url in feeds.items()
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                outcomes[source] = future.result()
+            except Exception as e:
+                outcomes[source] = e
+    return outcomes
+
+
+def test_rss_feeds(out: Console = console):
     """Test RSS feed fetching."""
-    console.print("\n[bold blue]═══ Testing RSS Feeds ═══[/bold blue]\n")
+    out.print("\n[bold blue]═══ Testing RSS Feeds ═══[/bold blue]\n")
     
     from src.infrastructure.clients.rss_client import RSSClient
     from src.config.constants import RSS_FEEDS
     
     client = RSSClient(timeout=15, cache_seconds=0)  # No cache for testing
     
-    # Test each feed individually
+    # Test each feed individually, fetching all of them concurrently
+    out.print(f"  Fetching {len(RSS_FEEDS)} feeds...")
+    fetched = _fetch_all_feeds(client, RSS_FEEDS)
+    
     results = []
-    for source, url in RSS_FEEDS.items():
-        try:
-            console.print(f"  Fetching [cyan]{source}[/cyan]...", end=" ")
-            items = client.fetch_crypto_news({source: url})
-            results.append((source, len(items), "✅"))
-            console.print(f"[green]✅ {len(items)} items[/green]")
-        except Exception as e:
-            results.append((source, 0, f"❌ {str(e)[:50]}"))
-            console.print(f"[red]❌ {str(e)[:50]}[/red]")
+    for source in RSS_FEEDS:
+        outcome = fetched[source]
+        out.print(f"  [cyan]{source}[/cyan]:", end=" ")
+        if isinstance(outcome, Exception):
+            err_msg = f"{outcome!s:.50}"
+            results.append((source, 0, f"❌ {err_msg}"))
+            out.print(f"[red]❌ {err_msg}[/red]")
+        else:
+            results.append((source, len(outcome), "✅"))
+            out.print(f"[green]✅ {len(outcome)} items[/green]")
     
     # Show sample headlines
-    console.print("\n[bold]Sample Headlines:[/bold]")
+    out.print("\n[bold]Sample Headlines:[/bold]")
     all_news = client.fetch_crypto_news()
     
     table = Table(show_header=True, header_style="bold magenta")
@@ -56,30 +89,32 @@ def test_rss_feeds():
     table.add_column("Symbol", style="green", width=12)
     table.add_column("Age", style="yellow", width=10)
     
+    now_utc = datetime.now(timezone.utc)
     for item in all_news[:10]:
         age = ""
         if item.published_at:
-            age_mins = (datetime.now(item.published_at.tzinfo) - item.published_at).total_seconds() / 60
-            if age_mins < 60:
-                age = f"{int(age_mins)}m ago"
-            else:
-                age = f"{int(age_mins/60)}h ago"
+            # published_at is timezone-aware (parse_rss_date defaults to UTC)
+            # Clamp so slightly future-dated items (feed clock skew) show as 0m
+            age_mins = max(0, int((now_utc - item.published_at).total_seconds()) // 60)
+            hours, mins = divmod(age_mins, 60)
+            age = "%dm ago" % mins if hours == 0 else "%dh ago" % hours
         
         table.add_row(
             item.source,
-            item.title[:58] + "..." if len(item.title) > 58 else item.title,
+            f"{item.title:.58}" + ("..." if len(item.title) > 58 else ""),
             item.detected_symbol or "-",
             age,
         )
     
-    console.print(table)
+    out.print(table)
+    client.close()
     
     return all(r[2] == "✅" for r in results)
 
 
-def test_market_data():
+def test_market_data(out: Console = console):
     """Test market data fetching from Binance."""
-    console.print("\n[bold blue]═══ Testing Market Data (Binance) ═══[/bold blue]\n")
+    out.print("\n[bold blue]═══ Testing Market Data (Binance) ═══[/bold blue]\n")
     
     from src.infrastructure.exchange.paper import PaperExchange
     
@@ -89,7 +124,7 @@ def test_market_data():
     symbols = ["BTC/USDC", "ETH/USDC", "SOL/USDC"]
     
     # Test tickers
-    console.print("[bold]Current Prices:[/bold]")
+    out.print("[bold]Current Prices:[/bold]")
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Symbol", style="cyan")
     table.add_column("Bid", justify="right")
@@ -97,23 +132,30 @@ def test_market_data():
     table.add_column("Last", justify="right", style="green")
     table.add_column("Volume (24h)", justify="right")
     
+    # One batched request for all symbols
+    try:
+        tickers = exchange.get_tickers(symbols)
+    except Exception as e:
+        out.print(f"[red]Failed to get tickers: {e}[/red]")
+        tickers = {}
+    
     for symbol in symbols:
-        try:
-            ticker = exchange.get_ticker(symbol)
-            table.add_row(
-                symbol,
-                f"${ticker.bid:,.2f}",
-                f"${ticker.ask:,.2f}",
-                f"${ticker.last:,.2f}",
-                f"${ticker.volume:,.0f}",
-            )
-        except Exception as e:
-            console.print(f"[red]Failed to get {symbol}: {e}[/red]")
+        ticker = tickers.get(symbol)
+        if ticker is None:
+            out.print(f"[red]Failed to get {symbol}: no ticker returned[/red]")
+            continue
+        table.add_row(
+            symbol,
+            f"${ticker.bid:,.2f}",
+            f"${ticker.ask:,.2f}",
+            f"${ticker.last:,.2f}",
+            f"${ticker.volume:,.0f}",
+        )
     
-    console.print(table)
+    out.print(table)
     
     # Test OHLCV
-    console.print("\n[bold]OHLCV Data (BTC/USDC 4h, last 5 candles):[/bold]")
+    out.print("\n[bold]OHLCV Data (BTC/USDC 4h, last 5 candles):[/bold]")
     try:
         candles = exchange.get_ohlcv("BTC/USDC", "4h", 5)
         
@@ -135,63 +177,63 @@ def test_market_data():
                 f"{c.volume:,.2f}",
             )
         
-        console.print(table)
+        out.print(table)
         return True
     except Exception as e:
-        console.print(f"[red]Failed to get OHLCV: {e}[/red]")
+        out.print(f"[red]Failed to get OHLCV: {e}[/red]")
         return False
 
 
-def test_paper_trading():
+def test_paper_trading(out: Console = console):
     """Test paper trading simulation."""
-    console.print("\n[bold blue]═══ Testing Paper Trading ═══[/bold blue]\n")
+    out.print("\n[bold blue]═══ Testing Paper Trading ═══[/bold blue]\n")
     
     from src.infrastructure.exchange.paper import PaperExchange
     
     exchange = PaperExchange(initial_balance=10000)
     
-    console.print(f"Initial balance: [green]${exchange.get_balance('USDC').total:,.2f}[/green]")
+    out.print(f"Initial balance: [green]${exchange.get_balance('USDC').total:,.2f}[/green]")
     
     # Simulate a buy
-    console.print("\nSimulating BTC buy...")
+    out.print("\nSimulating BTC buy...")
     result = exchange.market_buy("BTC/USDC", 0.01)
-    console.print(f"  Order ID: {result.order_id}")
-    console.print(f"  Fill price: ${result.price:,.2f}")
-    console.print(f"  Fee: ${result.fee:.4f}")
+    out.print(f"  Order ID: {result.order_id}")
+    out.print(f"  Fill price: ${result.price:,.2f}")
+    out.print(f"  Fee: ${result.fee:.4f}")
     
     # Check position
     position = exchange.get_position("BTC/USDC")
-    console.print(f"  Position: {position} BTC")
+    out.print(f"  Position: {position} BTC")
     
     # Simulate stop loss
     stop_price = result.price * 0.9
     stop_result = exchange.stop_loss_order("BTC/USDC", 0.01, stop_price)
-    console.print(f"\nStop loss placed at ${stop_price:,.2f}")
+    out.print(f"\nStop loss placed at ${stop_price:,.2f}")
     
     # Check balances
-    console.print(f"\nCurrent USDC: [yellow]${exchange.get_balance('USDC').total:,.2f}[/yellow]")
-    console.print(f"Current BTC: [yellow]{exchange.get_balance('BTC').total:.6f}[/yellow]")
+    out.print(f"\nCurrent USDC: [yellow]${exchange.get_balance('USDC').total:,.2f}[/yellow]")
+    out.print(f"Current BTC: [yellow]{exchange.get_balance('BTC').total:.6f}[/yellow]")
     
     # Simulate sell
-    console.print("\nSimulating BTC sell...")
+    out.print("\nSimulating BTC sell...")
     sell_result = exchange.market_sell("BTC/USDC", 0.01)
-    console.print(f"  Sell price: ${sell_result.price:,.2f}")
+    out.print(f"  Sell price: ${sell_result.price:,.2f}")
     
     # Final P&L
     pnl = exchange.get_pnl()
-    console.print(f"\n[bold]Final P&L:[/bold]")
-    console.print(f"  Initial: ${pnl['initial_balance']:,.2f}")
-    console.print(f"  Current: ${pnl['current_equity']:,.2f}")
+    out.print(f"\n[bold]Final P&L:[/bold]")
+    out.print(f"  Initial: ${pnl['initial_balance']:,.2f}")
+    out.print(f"  Current: ${pnl['current_equity']:,.2f}")
     
     pnl_color = "green" if pnl['pnl_amount'] >= 0 else "red"
-    console.print(f"  P&L: [{pnl_color}]${pnl['pnl_amount']:+,.2f} ({pnl['pnl_percent']:+.2%})[/{pnl_color}]")
+    out.print(f"  P&L: [{pnl_color}]${pnl['pnl_amount']:+,.2f} ({pnl['pnl_percent']:+.2%})[/{pnl_color}]")
     
     return True
 
 
-def test_database():
+def test_database(out: Console = console):
     """Test database connectivity."""
-    console.print("\n[bold blue]═══ Testing Database ═══[/bold blue]\n")
+    out.print("\n[bold blue]═══ Testing Database ═══[/bold blue]\n")
     
     try:
         from src.infrastructure.database import DatabaseManager
@@ -199,31 +241,36 @@ def test_database():
         # Try to connect with a test URL (SQLite for testing)
         test_db_url = "sqlite:///data/test_fusionbot.db"
         
-        console.print(f"Connecting to: [cyan]{test_db_url}[/cyan]")
+        out.print(f"Connecting to: [cyan]{test_db_url}[/cyan]")
         
         db = DatabaseManager(test_db_url)
         db.init_db()
         
         if db.health_check():
-            console.print("[green]✅ Database connection successful[/green]")
+            out.print("[green]✅ Database connection successful[/green]")
             
             # Test a simple query
+            from src.infrastructure.database.repositories import SystemStateRepository
             with db.session() as session:
-                from src.infrastructure.database.repositories import SystemStateRepository
                 repo = SystemStateRepository(session)
                 repo.set("test_key", "test_value")
                 value = repo.get("test_key")
-                console.print(f"  Write/Read test: [green]✅ Passed[/green]")
             
             db.close()
+            
+            if value != "test_value":
+                out.print(f"  Write/Read test: [red]❌ Failed (read back {value!r})[/red]")
+                return False
+            
+            out.print(f"  Write/Read test: [green]✅ Passed[/green]")
             return True
         else:
-            console.print("[red]❌ Database health check failed[/red]")
+            out.print("[red]❌ Database health check failed[/red]")
             return False
             
     except Exception as e:
-        console.print(f"[red]❌ Database error: {e}[/red]")
-        console.print("[yellow]Note: For PostgreSQL, ensure the database server is running[/yellow]")
+        out.print(f"[red]❌ Database error: {e}[/red]")
+        out.print("[yellow]Note: For PostgreSQL, ensure the database server is running[/yellow]")
         return False
 
 
@@ -236,35 +283,14 @@ def main():
         border_style="blue",
     ))
     
-    results = {}
-    
-    # Test RSS
-    try:
-        results["RSS Feeds"] = test_rss_feeds()
-    except Exception as e:
-        console.print(f"[red]RSS test failed: {e}[/red]")
-        results["RSS Feeds"] = False
-    
-    # Test Market Data
-    try:
-        results["Market Data"] = test_market_data()
-    except Exception as e:
-        console.print(f"[red]Market data test failed: {e}[/red]")
-        results["Market Data"] = False
-    
-    # Test Paper Trading
-    try:
-        results["Paper Trading"] = test_paper_trading()
-    except Exception as e:
-        console.print(f"[red]Paper trading test failed: {e}[/red]")
-        results["Paper Trading"] = False
-    
-    # Test Database
-    try:
-        results["Database"] = test_database()
-    except Exception as e:
-        console.print(f"[red]Database test failed: {e}[/red]")
-        results["Database"] = False
+    # The stages wait on different hosts (RSS feeds, Binance, the database),
+    # so overlapping them makes the total wait close to the slowest stage
+    results = run_concurrently({
+        "RSS Feeds": test_rss_feeds,
+        "Market Data": test_market_data,
+        "Paper Trading": test_paper_trading,
+        "Database": test_database,
+    }, console)
     
     # Summary
     console.print("\n" + "═" * 50)
@@ -11,30 +11,31 @@ Usage:
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from datetime import datetime, timezone
-from src.services.notifier import get_notifier
-from src.core.enums import ExitReason
-from src.core.models import Position
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from scripts._runner import run_concurrently
+
 console = Console()
 
+# Cap on tests running at once, keeping bursts well under Telegram's rate limits
+MAX_CONCURRENT_TESTS = 4
+
 
-def test_trade_opened():
+def test_trade_opened(notifier, out: Console = console):
     """Test trade opened notification."""
-    console.print("\n[bold cyan]Testing: Trade Opened Notification[/bold cyan]")
+    out.print("\n[bold cyan]Testing: Trade Opened Notification[/bold cyan]")
     
-    notifier = get_notifier()
     if not notifier:
-        console.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
+        out.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
         return False
     
     success = notifier.send_trade_opened(
@@ -45,20 +46,21 @@ def test_trade_opened():
     )
     
     if success:
-        console.print("[green]✅ Trade opened notification sent successfully[/green]")
+        out.print("[green]✅ Trade opened notification sent successfully[/green]")
     else:
-        console.print("[red]❌ Failed to send trade opened notification[/red]")
+        out.print("[red]❌ Failed to send trade opened notification[/red]")
     
     return success
 
 
-def test_trade_closed():
+def test_trade_closed(notifier, out: Console = console):
     """Test trade closed notification."""
-    console.print("\n[bold cyan]Testing: Trade Closed Notification[/bold cyan]")
+    from src.core.enums import ExitReason
+    
+    out.print("\n[bold cyan]Testing: Trade Closed Notification[/bold cyan]")
     
-    notifier = get_notifier()
     if not notifier:
-        console.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
+        out.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
         return False
     
     # Test profitable trade
@@ -95,20 +97,19 @@ def test_trade_closed():
     )
     
     if success1 and success2 and success3:
-        console.print("[green]✅ All trade closed notifications sent successfully[/green]")
+        out.print("[green]✅ All trade closed notifications sent successfully[/green]")
         return True
     else:
-        console.print("[red]❌ Some trade closed notifications failed[/red]")
+        out.print("[red]❌ Some trade closed notifications failed[/red]")
         return False
 
 
-def test_catastrophe_stop():
+def test_catastrophe_stop(notifier, out: Console = console):
     """Test catastrophe stop notification."""
-    console.print("\n[bold cyan]Testing: Catastrophe Stop Notification[/bold cyan]")
+    out.print("\n[bold cyan]Testing: Catastrophe Stop Notification[/bold cyan]")
     
-    notifier = get_notifier()
     if not notifier:
-        console.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
+        out.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
         return False
     
     success = notifier.send_catastrophe_stop(
@@ -120,20 +121,19 @@ def test_catastrophe_stop():
     )
     
     if success:
-        console.print("[green]✅ Catastrophe stop notification sent successfully[/green]")
+        out.print("[green]✅ Catastrophe stop notification sent successfully[/green]")
     else:
-        console.print("[red]❌ Failed to send catastrophe stop notification[/red]")
+        out.print("[red]❌ Failed to send catastrophe stop notification[/red]")
     
     return success
 
 
-def test_external_close():
+def test_external_close(notifier, out: Console = console):
     """Test external close notification."""
-    console.print("\n[bold cyan]Testing: External Close Notification[/bold cyan]")
+    out.print("\n[bold cyan]Testing: External Close Notification[/bold cyan]")
     
-    notifier = get_notifier()
     if not notifier:
-        console.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
+        out.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
         return False
     
     success = notifier.send_external_close(
@@ -144,20 +144,19 @@ def test_external_close():
     )
     
     if success:
-        console.print("[green]✅ External close notification sent successfully[/green]")
+        out.print("[green]✅ External close notification sent successfully[/green]")
     else:
-        console.print("[red]❌ Failed to send external close notification[/red]")
+        out.print("[red]❌ Failed to send external close notification[/red]")
     
     return success
 
 
-def test_system_failure():
+def test_system_failure(notifier, out: Console = console):
     """Test system failure notification."""
-    console.print("\n[bold cyan]Testing: System Failure Notification[/bold cyan]")
+    out.print("\n[bold cyan]Testing: System Failure Notification[/bold cyan]")
     
-    notifier = get_notifier()
     if not notifier:
-        console.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
+        out.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
         return False
     
     success = notifier.send_system_failure(
@@ -166,20 +165,19 @@ def test_system_failure():
     )
     
     if success:
-        console.print("[green]✅ System failure notification sent successfully[/green]")
+        out.print("[green]✅ System failure notification sent successfully[/green]")
     else:
-        console.print("[red]❌ Failed to send system failure notification[/red]")
+        out.print("[red]❌ Failed to send system failure notification[/red]")
     
     return success
 
 
-def test_exchange_error():
+def test_exchange_error(notifier, out: Console = console):
     """Test exchange error notification."""
-    console.print("\n[bold cyan]Testing: Exchange Error Notification[/bold cyan]")
+    out.print("\n[bold cyan]Testing: Exchange Error Notification[/bold cyan]")
     
-    notifier = get_notifier()
     if not notifier:
-        console.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
+        out.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
         return False
     
     # Test rate limit error
@@ -201,20 +199,19 @@ def test_exchange_error():
     )
     
     if success1 and success2 and success3:
-        console.print("[green]✅ All exchange error notifications sent successfully[/green]")
+        out.print("[green]✅ All exchange error notifications sent successfully[/green]")
         return True
     else:
-        console.print("[red]❌ Some exchange error notifications failed[/red]")
+        out.print("[red]❌ Some exchange error notifications failed[/red]")
         return False
 
 
-def test_generic_message():
+def test_generic_message(notifier, out: Console = console):
     """Test generic message notification."""
-    console.print("\n[bold cyan]Testing: Generic Message Notification[/bold cyan]")
+    out.print("\n[bold cyan]Testing: Generic Message Notification[/bold cyan]")
     
-    notifier = get_notifier()
     if not notifier:
-        console.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
+        out.print("[yellow]⚠️  Telegram not configured - skipping[/yellow]")
         return False
     
     # Test different priority levels
@@ -223,10 +220,10 @@ def test_generic_message():
     success3 = notifier.send("This is an INFO message", priority="INFO")
     
     if success1 and success2 and success3:
-        console.print("[green]✅ All generic message notifications sent successfully[/green]")
+        out.print("[green]✅ All generic message notifications sent successfully[/green]")
         return True
     else:
-        console.print("[red]❌ Some generic message notifications failed[/red]")
+        out.print("[red]❌ Some generic message notifications failed[/red]")
         return False
 
 
@@ -272,15 +269,25 @@ def main():
         console.print("\n[yellow]Continuing with tests anyway (will show skipped messages)...[/yellow]")
     
     # Run all tests
-    results = {
-        "Trade Opened": test_trade_opened(),
-        "Trade Closed": test_trade_closed(),
-        "Catastrophe Stop": test_catastrophe_stop(),
-        "External Close": test_external_close(),
-        "System Failure": test_system_failure(),
-        "Exchange Error": test_exchange_error(),
-        "Generic Message": test_generic_message(),
+    # One notifier (and one HTTP session) for the whole run
+    from src.services.notifier import get_notifier
+    notifier = get_notifier()
+    
+    # Each test is dominated by its HTTPS round-trips to Telegram
+    tests = {
+        "Trade Opened": test_trade_opened,
+        "Trade Closed": test_trade_closed,
+        "Catastrophe Stop": test_catastrophe_stop,
+        "External Close": test_external_close,
+        "System Failure": test_system_failure,
+        "Exchange Error": test_exchange_error,
+        "Generic Message": test_generic_message,
     }
+    results = run_concurrently(
+        {name: partial(test, notifier) for name, test in tests.items()},
+        console,
+        max_workers=MAX_CONCURRENT_TESTS,
+    )
     
     # Summary
     console.print("\n" + "=" * 60)
@@ -1,11 +1,11 @@
 """Configuration module for FusionBot."""
 
-from src.config.settings import Settings, get_settings
 from src.config.constants import (
     RSS_FEEDS,
     MACRO_RSS_FEEDS,
     DANGER_KEYWORDS,
     SUPPORTED_SYMBOLS,
+    ALIAS_TO_SYMBOL,
 )
 
 __all__ = [
@@ -15,5 +15,18 @@ __all__ = [
     "MACRO_RSS_FEEDS",
     "DANGER_KEYWORDS",
     "SUPPORTED_SYMBOLS",
+    "ALIAS_TO_SYMBOL",
 ]
 
+
+def __getattr__(name: str):
+    """
+    Import settings on first access.
+    
+    Keeps pydantic out of processes that only need the constants
+    (e.g. `from src.config.constants import ...`).
+    """
+    if name in ("Settings", "get_settings"):
+        from src.config import settings
+        return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
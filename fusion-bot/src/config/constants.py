@@ -5,35 +5,43 @@ Constants for FusionBot
 Static configuration values that don't change at runtime.
 """
 
-from typing import Dict, List
+import sys
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Tuple
+
+
+def _normalize_keywords(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """Lowercase and intern keywords once, so matchers never re-lowercase them."""
+    return tuple(sys.intern(k.lower()) for k in keywords)
+
 
 # ============================================
 # RSS FEEDS - Crypto News Sources
 # ============================================
 
-RSS_FEEDS: Dict[str, str] = {
+RSS_FEEDS: Mapping[str, str] = MappingProxyType({
     "cointelegraph": "https://cointelegraph.com/rss",
     "coindesk": "https://www.coindesk.com/arc/outboundfeeds/rss/",
     "bitcoin_magazine": "https://bitcoinmagazine.com/.rss/full/",
     "decrypt": "https://decrypt.co/feed",
-}
+})
 
 # ============================================
 # MACRO RSS FEEDS - Financial News for Risk Detection
 # ============================================
 
-MACRO_RSS_FEEDS: Dict[str, str] = {
+MACRO_RSS_FEEDS: Mapping[str, str] = MappingProxyType({
     "yahoo_finance": "https://finance.yahoo.com/news/rssindex",
     # Reuters feed is broken (404), using MarketWatch instead
     "marketwatch": "https://feeds.marketwatch.com/marketwatch/topstories/",
     "cnbc": "https://www.cnbc.com/id/100003114/device/rss/rss.html",
-}
+})
 
 # ============================================
 # DANGER KEYWORDS - Trigger Defensive Mode
 # ============================================
 
-DANGER_KEYWORDS: List[str] = [
+DANGER_KEYWORDS: Tuple[str, ...] = _normalize_keywords((
     # Federal Reserve
     "fed",
     "federal reserve",
@@ -81,31 +89,40 @@ DANGER_KEYWORDS: List[str] = [
     "ponzi",
     "insolvency",
     "bankruptcy",
-]
+))
 
 # ============================================
 # SUPPORTED SYMBOLS - Trading Pairs
 # ============================================
 
-SUPPORTED_SYMBOLS: Dict[str, List[str]] = {
-    "BTC/USDC": ["bitcoin", "btc", "₿"],
-    "ETH/USDC": ["ethereum", "eth", "ether"],
-    "SOL/USDC": ["solana", "sol"],
-    "SOL/USDC": ["solana", "sol"],
-    "XRP/USDC": ["ripple", "xrp"],
-    "ADA/USDC": ["cardano", "ada"],
-    "AVAX/USDC": ["avalanche", "avax"],
-    "DOT/USDC": ["polkadot", "dot"],
-    "LINK/USDC": ["chainlink", "link"],
-    "MATIC/USDC": ["polygon", "matic"],
-    "ATOM/USDC": ["cosmos", "atom"],
-}
+SUPPORTED_SYMBOLS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    symbol: _normalize_keywords(aliases)
+    for symbol, aliases in {
+        "BTC/USDC": ["bitcoin", "btc", "₿"],
+        "ETH/USDC": ["ethereum", "eth", "ether"],
+        "SOL/USDC": ["solana", "sol"],
+        "XRP/USDC": ["ripple", "xrp"],
+        "ADA/USDC": ["cardano", "ada"],
+        "AVAX/USDC": ["avalanche", "avax"],
+        "DOT/USDC": ["polkadot", "dot"],
+        "LINK/USDC": ["chainlink", "link"],
+        "MATIC/USDC": ["polygon", "matic"],
+        "ATOM/USDC": ["cosmos", "atom"],
+    }.items()
+})
+
+# Reverse index for symbol detection: keyword -> trading pair
+ALIAS_TO_SYMBOL: Mapping[str, str] = MappingProxyType({
+    alias: symbol
+    for symbol, aliases in SUPPORTED_SYMBOLS.items()
+    for alias in aliases
+})
 
 # ============================================
 # TECHNICAL ANALYSIS PARAMETERS
 # ============================================
 
-TA_PARAMS = {
+TA_PARAMS: Mapping[str, Any] = MappingProxyType({
     "rsi_period": 14,
     "rsi_overbought": 70,
     "rsi_oversold": 30,
@@ -117,37 +134,37 @@ TA_PARAMS = {
     "atr_period": 14,
     "candle_timeframe": "4h",
     "candles_to_fetch": 100,
-}
+})
 
 # ============================================
 # API RATE LIMITS
 # ============================================
 
-RATE_LIMITS = {
+RATE_LIMITS: Mapping[str, Any] = MappingProxyType({
     "binance_requests_per_minute": 1200,
     "binance_orders_per_second": 10,
     "gemini_requests_per_minute": 60,
     "rss_min_interval_seconds": 60,
-}
+})
 
 # ============================================
 # RETRY CONFIGURATION
 # ============================================
 
-RETRY_CONFIG = {
+RETRY_CONFIG: Mapping[str, Any] = MappingProxyType({
     "max_attempts": 3,
     "initial_delay_seconds": 1,
     "max_delay_seconds": 30,
     "exponential_base": 2,
-}
+})
 
 # ============================================
 # HEALTH CHECK THRESHOLDS
 # ============================================
 
-HEALTH_THRESHOLDS = {
+HEALTH_THRESHOLDS: Mapping[str, Any] = MappingProxyType({
     "max_api_latency_ms": 5000,
     "max_heartbeat_age_seconds": 30,
     "min_account_balance_usdc": 10,
-}
+})
 
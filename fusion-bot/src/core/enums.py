@@ -3,6 +3,9 @@ Enums for FusionBot
 ===================
 
 Type-safe enumerations for all domain concepts.
+
+All enums mix in str and use str.__str__ directly, so str(member) returns
+the plain value without a Python-level call.
 """
 
 from enum import Enum, auto
@@ -15,8 +18,7 @@ class TradeAction(str, Enum):
     WAIT = "WAIT"
     SELL = "SELL"  # For future short support
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class TradeStatus(str, Enum):
@@ -29,8 +31,7 @@ class TradeStatus(str, Enum):
     CANCELLED = "CANCELLED"  # Order cancelled before fill
     FAILED = "FAILED"        # Order failed to execute
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class TradeSide(str, Enum):
@@ -39,8 +40,7 @@ class TradeSide(str, Enum):
     BUY = "BUY"
     SELL = "SELL"
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class ExitReason(str, Enum):
@@ -56,8 +56,7 @@ class ExitReason(str, Enum):
     SYNC_MISSING = "SYNC_MISSING"       # Position not found on exchange
     EXTERNAL_CLOSE = "EXTERNAL_CLOSE"   # Position sold externally (manual/compromise) - stop order still open
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class MarketRegime(str, Enum):
@@ -69,8 +68,7 @@ class MarketRegime(str, Enum):
     HIGH_VOLATILITY = "HIGH_VOLATILITY"
     UNKNOWN = "UNKNOWN"
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class TrendDirection(str, Enum):
@@ -80,8 +78,7 @@ class TrendDirection(str, Enum):
     BEARISH = "BEARISH"
     NEUTRAL = "NEUTRAL"
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class SystemMode(str, Enum):
@@ -92,8 +89,7 @@ class SystemMode(str, Enum):
     MAINTENANCE = "MAINTENANCE"     # System under maintenance
     SHUTDOWN = "SHUTDOWN"           # Graceful shutdown in progress
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class NewsStatus(str, Enum):
@@ -132,23 +128,29 @@ class NewsStatus(str, Enum):
     POSITION_LIMIT = "POS_LIMIT"        # Max positions reached
     EXECUTION_FAILED = "EXEC_FAILED"    # Trade execution failed
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
     
     @classmethod
     def is_rejection(cls, status: "NewsStatus") -> bool:
         """Check if this status represents a rejection."""
-        rejections = {
-            cls.HARD_LIMIT_RSI, cls.HARD_LIMIT_AGE, cls.HARD_LIMIT_OTHER,
-            cls.NO_SYMBOL, cls.NOT_IN_WATCHLIST, cls.DUPLICATE, cls.POSITION_EXISTS,
-            cls.VETO_CONFIDENCE, cls.VETO_INCONSISTENT, cls.EXECUTION_FAILED,
-        }
-        return status in rejections
+        return status in cls._REJECTION_STATUSES
     
     @classmethod
     def is_ai_decision(cls, status: "NewsStatus") -> bool:
         """Check if this status came from AI decision."""
-        return status in {cls.SELECTED, cls.COMPARED_OUT, cls.AI_WAIT}
+        return status in cls._AI_DECISION_STATUSES
+
+
+# Built once at import; assigned after the class body so Enum doesn't treat them as members
+NewsStatus._REJECTION_STATUSES = frozenset({
+    NewsStatus.HARD_LIMIT_RSI, NewsStatus.HARD_LIMIT_AGE, NewsStatus.HARD_LIMIT_OTHER,
+    NewsStatus.NO_SYMBOL, NewsStatus.NOT_IN_WATCHLIST, NewsStatus.DUPLICATE,
+    NewsStatus.POSITION_EXISTS, NewsStatus.VETO_CONFIDENCE, NewsStatus.VETO_INCONSISTENT,
+    NewsStatus.EXECUTION_FAILED,
+})
+NewsStatus._AI_DECISION_STATUSES = frozenset({
+    NewsStatus.SELECTED, NewsStatus.COMPARED_OUT, NewsStatus.AI_WAIT,
+})
 
 
 class RSIZone(str, Enum):
@@ -158,8 +160,7 @@ class RSIZone(str, Enum):
     NEUTRAL = "NEUTRAL"         # 30 <= RSI <= 70
     OVERBOUGHT = "OVERBOUGHT"   # RSI > 70
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
 
 class MACDSignal(str, Enum):
@@ -170,6 +171,5 @@ class MACDSignal(str, Enum):
     BULLISH = "BULLISH"               # MACD above signal
     BEARISH = "BEARISH"               # MACD below signal
     
-    def __str__(self) -> str:
-        return self.value
+    __str__ = str.__str__
 
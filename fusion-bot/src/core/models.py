@@ -20,8 +20,11 @@ from src.core.enums import (
     MACDSignal,
 )
 
+# Statuses in which a position still holds (or is acquiring) exposure
+_OPEN_STATUSES = frozenset({TradeStatus.PENDING, TradeStatus.OPEN})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class NewsItem:
     """
     Represents a news article from RSS feed.
@@ -46,13 +49,26 @@ class NewsItem:
     
     def __post_init__(self):
         """Normalize title."""
-        self.title = self.title.strip() if self.title else ""
+        # Frozen dataclass: bypass the generated __setattr__ guard
+        object.__setattr__(self, "title", self.title.strip() if self.title else "")
     
     @property
     def age_seconds(self) -> Optional[float]:
         """Get age of news item in seconds."""
+        return self.get_age_seconds()
+    
+    def get_age_seconds(self, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Get age of news item in seconds.
+        
+        Args:
+            now: Reference time; pass one shared value when checking many items
+        
+        Returns:
+            Age in seconds, or None if the publish time is unknown
+        """
         if self.published_at:
-            return (datetime.utcnow() - self.published_at).total_seconds()
+            return ((now or datetime.utcnow()) - self.published_at).total_seconds()
         return None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -67,7 +83,7 @@ class NewsItem:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TechnicalSignals:
     """
     Technical analysis signals computed from OHLCV data.
@@ -115,52 +131,46 @@ class TechnicalSignals:
     
     computed_at: datetime = field(default_factory=datetime.utcnow)
     
-    @property
-    def is_overbought(self) -> bool:
-        """Check if RSI indicates overbought condition."""
-        return self.rsi_zone == RSIZone.OVERBOUGHT
+    # Derived flags, computed once in __post_init__ (the instance is immutable)
+    is_overbought: bool = field(init=False, repr=False, compare=False)
+    is_oversold: bool = field(init=False, repr=False, compare=False)
+    is_bullish: bool = field(init=False, repr=False, compare=False)
+    is_bearish: bool = field(init=False, repr=False, compare=False)
     
-    @property
-    def is_oversold(self) -> bool:
-        """Check if RSI indicates oversold condition."""
-        return self.rsi_zone == RSIZone.OVERSOLD
-    
-    @property
-    def is_bullish(self) -> bool:
-        """Check if overall technicals are bullish."""
-        return (
+    def __post_init__(self):
+        """Compute derived RSI/trend flags."""
+        is_overbought = self.rsi_zone == RSIZone.OVERBOUGHT
+        object.__setattr__(self, "is_overbought", is_overbought)
+        object.__setattr__(self, "is_oversold", self.rsi_zone == RSIZone.OVERSOLD)
+        object.__setattr__(self, "is_bullish", (
             self.trend == TrendDirection.BULLISH
             and self.macd_indication in (MACDSignal.BULLISH, MACDSignal.BULLISH_CROSS)
-            and not self.is_overbought
-        )
-    
-    @property
-    def is_bearish(self) -> bool:
-        """Check if overall technicals are bearish."""
-        return (
+            and not is_overbought
+        ))
+        object.__setattr__(self, "is_bearish", (
             self.trend == TrendDirection.BEARISH
             or self.macd_indication in (MACDSignal.BEARISH, MACDSignal.BEARISH_CROSS)
-        )
+        ))
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for AI prompt."""
+        """Convert to dictionary for logging/serialization."""
         return {
             "symbol": self.symbol,
             "current_price": self.current_price,
             "rsi": round(self.rsi, 2),
-            "rsi_zone": str(self.rsi_zone),
-            "trend": str(self.trend),
+            "rsi_zone": self.rsi_zone.value,
+            "trend": self.trend.value,
             "ema_short": round(self.ema_short, 2),
             "ema_long": round(self.ema_long, 2),
             "macd": round(self.macd, 4),
             "macd_signal": round(self.macd_signal, 4),
             "macd_histogram": round(self.macd_histogram, 4),
-            "macd_indication": str(self.macd_indication),
+            "macd_indication": self.macd_indication.value,
             "atr_percent": round(self.atr_percent, 4),
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FusionDecision:
     """
     Decision output from the Fusion Brain (AI analysis).
@@ -201,7 +211,7 @@ class FusionDecision:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeEntry:
     """
     Parameters for entering a new trade.
@@ -246,7 +256,7 @@ class TradeEntry:
         return reward / risk if risk > 0 else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     An active trading position.
@@ -288,30 +298,43 @@ class Position:
     pnl_amount: Optional[float] = None
     pnl_percent: Optional[float] = None
     
+    # +1 for long, -1 for short; lets price checks skip the side comparison
+    _direction: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the trade direction multiplier."""
+        self._direction = 1 if self.side == TradeSide.BUY else -1
+    
     @property
     def is_open(self) -> bool:
         """Check if position is still open."""
-        return self.status in (TradeStatus.PENDING, TradeStatus.OPEN)
+        return self.status in _OPEN_STATUSES
     
     @property
     def age_hours(self) -> float:
         """Get position age in hours."""
-        delta = datetime.utcnow() - self.opened_at
+        return self.get_age_hours()
+    
+    def get_age_hours(self, now: Optional[datetime] = None) -> float:
+        """
+        Get position age in hours.
+        
+        Args:
+            now: Reference time; pass one shared value when checking many positions
+        
+        Returns:
+            Hours since the position was opened
+        """
+        delta = (now or datetime.utcnow()) - self.opened_at
         return delta.total_seconds() / 3600
     
     def check_virtual_sl(self, current_price: float) -> bool:
         """Check if virtual stop loss is hit."""
-        if self.side == TradeSide.BUY:
-            return current_price <= self.virtual_sl
-        else:
-            return current_price >= self.virtual_sl
+        return self._direction * (current_price - self.virtual_sl) <= 0
     
     def check_virtual_tp(self, current_price: float) -> bool:
         """Check if virtual take profit is hit."""
-        if self.side == TradeSide.BUY:
-            return current_price >= self.virtual_tp
-        else:
-            return current_price <= self.virtual_tp
+        return self._direction * (current_price - self.virtual_tp) >= 0
     
     def calculate_pnl(self, exit_price: float) -> tuple[float, float]:
         """
@@ -320,26 +343,28 @@ class Position:
         Returns:
             Tuple of (pnl_amount, pnl_percent)
         """
-        if self.side == TradeSide.BUY:
-            pnl_amount = (exit_price - self.entry_price) * self.quantity
-        else:
-            pnl_amount = (self.entry_price - exit_price) * self.quantity
+        pnl_amount = self._direction * (exit_price - self.entry_price) * self.quantity
         
         pnl_percent = pnl_amount / (self.entry_price * self.quantity)
         return pnl_amount, pnl_percent
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging."""
+    def to_dict(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for logging.
+        
+        Args:
+            now: Reference time for age_hours; pass one shared value for many positions
+        """
         return {
             "id": self.id,
             "symbol": self.symbol,
-            "side": str(self.side),
+            "side": self.side.value,
             "entry_price": self.entry_price,
             "quantity": self.quantity,
             "virtual_sl": self.virtual_sl,
             "virtual_tp": self.virtual_tp,
-            "status": str(self.status),
-            "age_hours": round(self.age_hours, 2),
+            "status": self.status.value,
+            "age_hours": round(self.get_age_hours(now), 2),
             "pnl_percent": self.pnl_percent,
         }
 
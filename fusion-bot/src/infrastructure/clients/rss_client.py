@@ -5,10 +5,14 @@ RSS Feed Client for FusionBot
 Fetches and parses news from crypto RSS feeds.
 """
 
+import heapq
+import io
 import time
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
+from datetime import datetime, timedelta, timezone
+from itertools import takewhile
+from typing import List, Dict, Mapping, Optional, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import feedparser
@@ -20,11 +24,51 @@ from src.core.models import NewsItem
 from src.core.exceptions import NewsParsingError
 from src.utils.logging import get_logger
 from src.utils.helpers import generate_news_id, parse_rss_date, extract_symbol_from_text
-from src.config.constants import RSS_FEEDS, MACRO_RSS_FEEDS, SUPPORTED_SYMBOLS
+from src.config.constants import RSS_FEEDS, MACRO_RSS_FEEDS, SUPPORTED_SYMBOLS, ALIAS_TO_SYMBOL
 from src.services.notifier import get_notifier
 
 logger = get_logger(__name__)
 
+# Entries kept per feed (feeds list newest first)
+MAX_ENTRIES_PER_FEED = 50
+
+# Summary characters kept per item; caps what cached items hold onto
+MAX_SUMMARY_CHARS = 500
+
+# Fail fast on unreachable hosts; the read timeout is RSSClient.timeout
+CONNECT_TIMEOUT_SECONDS = 3
+
+# Upper bound on a single retry sleep
+RETRY_BACKOFF_MAX_SECONDS = 2
+
+# Child elements read from an <item>/<entry>, keyed by local name, mapped to
+# the feedparser key _parse_entry expects
+_ENTRY_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "pubDate": "published",
+    "published": "published",
+    "updated": "updated",
+    "date": "updated",  # dc:date
+    "description": "summary",
+    "summary": "summary",
+}
+
+# Entry date fields in order of preference, with feedparser's parsed variant
+_DATE_FIELDS = (
+    ("published", "published_parsed"),
+    ("updated", "updated_parsed"),
+    ("created", "created_parsed"),
+)
+
+# Undated items sort after every dated one
+_MIN_PUBLISHED = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _published_key(item: NewsItem) -> datetime:
+    """Sort key for newest-first ordering of news items."""
+    return item.published_at or _MIN_PUBLISHED
+
 
 @dataclass
 class RSSFeedResult:
@@ -35,6 +79,15 @@ class RSSFeedResult:
     error: Optional[str] = None
 
 
+@dataclass
+class _FeedCacheEntry:
+    """Cached items for one feed plus the validators to revalidate them."""
+    expires_at: float  # time.monotonic() deadline
+    items: List[NewsItem]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
 class RSSClient:
     """
     Client for fetching and parsing RSS feeds.
@@ -70,17 +123,29 @@ class RSSClient:
         self.cache_seconds = cache_seconds
         self.max_workers = max_workers
         
-        # Cache: {source: (timestamp, items)}
-        self._cache: Dict[str, tuple[float, List[NewsItem]]] = {}
+        # Cache: {source: entry}; expired entries are kept for conditional GETs
+        self._cache: Dict[str, _FeedCacheEntry] = {}
         
         # Configure session with retries
         self.session = requests.Session()
+        # Short jittered backoff so a failing feed frees its worker quickly;
+        # Retry-After is ignored because it can exceed the whole poll interval
+        # (the next poll retries anyway)
         retry_strategy = Retry(
             total=3,
-            backoff_factor=0.5,
+            backoff_factor=0.3,
+            backoff_jitter=0.5,
+            backoff_max=RETRY_BACKOFF_MAX_SECONDS,
             status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=False,
+        )
+        # One kept-alive pool per feed host, each big enough for every worker,
+        # so parallel fetches reuse connections instead of re-handshaking TLS
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=len(RSS_FEEDS) + len(MACRO_RSS_FEEDS),
+            pool_maxsize=max_workers,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -91,24 +156,28 @@ class RSSClient:
         
         logger.info("RSS client initialized", cache_seconds=cache_seconds)
     
-    def _is_cached(self, source: str) -> bool:
-        """Check if feed is cached and still valid."""
-        if source not in self._cache:
-            return False
-        timestamp, _ = self._cache[source]
-        return (time.time() - timestamp) < self.cache_seconds
-    
     def _get_cached(self, source: str) -> Optional[List[NewsItem]]:
-        """Get cached items if valid."""
-        if self._is_cached(source):
-            _, items = self._cache[source]
-            logger.debug("Using cached RSS data", source=source)
-            return items
-        return None
+        """Get cached items if still fresh."""
+        entry = self._cache.get(source)
+        if entry is None or time.monotonic() >= entry.expires_at:
+            return None
+        logger.debug("Using cached RSS data", source=source)
+        return entry.items
     
-    def _update_cache(self, source: str, items: List[NewsItem]) -> None:
+    def _update_cache(
+        self,
+        source: str,
+        items: List[NewsItem],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
         """Update cache for a feed."""
-        self._cache[source] = (time.time(), items)
+        self._cache[source] = _FeedCacheEntry(
+            expires_at=time.monotonic() + self.cache_seconds,
+            items=items,
+            etag=etag,
+            last_modified=last_modified,
+        )
     
     def _fetch_feed(self, source: str, url: str) -> RSSFeedResult:
         """
@@ -133,32 +202,59 @@ class RSSClient:
         try:
             logger.debug("Fetching RSS feed", source=source, url=url)
             
+            # Revalidate against the last response; unchanged feeds answer 304 with no body
+            previous = self._cache.get(source)
+            headers = {}
+            if previous is not None:
+                if previous.etag:
+                    headers["If-None-Match"] = previous.etag
+                if previous.last_modified:
+                    headers["If-Modified-Since"] = previous.last_modified
+            
             # Fetch the feed
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(
+                url,
+                timeout=(CONNECT_TIMEOUT_SECONDS, self.timeout),
+                headers=headers,
+            )
+            
+            if response.status_code == 304 and previous is not None:
+                self._update_cache(source, previous.items, previous.etag, previous.last_modified)
+                logger.debug("RSS feed not modified", source=source)
+                return RSSFeedResult(
+                    source=source,
+                    items=previous.items,
+                    fetched_at=datetime.now(timezone.utc),
+                )
+            
             response.raise_for_status()
             
-            # Parse with feedparser
-            feed = feedparser.parse(response.content)
+            # Entries already parsed last time are reused as-is
+            known = {item.id: item for item in previous.items} if previous is not None else {}
             
-            if feed.bozo and not feed.entries:
-                raise NewsParsingError(source, f"Feed parsing error: {feed.bozo_exception}")
+            # Stream-parse well-formed XML; feedparser handles anything malformed
+            try:
+                entries = self._iter_entries_stream(response.content)
+                items = self._parse_entries(entries, source, known)
+            except ET.ParseError as e:
+                logger.debug("Streaming parse failed, using feedparser", source=source, error=str(e))
+                feed = feedparser.parse(response.content)
+                
+                if feed.bozo and not feed.entries:
+                    raise NewsParsingError(source, f"Feed parsing error: {feed.bozo_exception}")
+                
+                items = self._parse_entries(feed.entries, source, known)
             
-            # Convert entries to NewsItem
-            items: List[NewsItem] = []
-            for entry in feed.entries[:50]:  # Limit to 50 most recent
-                try:
-                    news_item = self._parse_entry(entry, source)
-                    items.append(news_item)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to parse RSS entry",
-                        source=source,
-                        error=str(e),
-                    )
-                    continue
+            # Cache newest first so fetch_crypto_news can merge instead of re-sorting
+            items.sort(key=_published_key, reverse=True)
             
             # Update cache
-            self._update_cache(source, items)
+            self._update_cache(
+                source,
+                items,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
             
             logger.info(
                 "RSS feed fetched successfully",
@@ -212,13 +308,90 @@ class RSSClient:
                 error=str(e),
             )
     
-    def _parse_entry(self, entry: Any, source: str) -> NewsItem:
+    def _parse_entries(
+        self,
+        entries,
+        source: str,
+        known: Optional[Mapping[str, NewsItem]] = None,
+    ) -> List[NewsItem]:
+        """
+        Convert up to MAX_ENTRIES_PER_FEED entries to NewsItem.
+        
+        Args:
+            entries: Iterable of feedparser entries or equivalent dicts;
+                consumed lazily, so a generator stops parsing at the limit
+            source: Source name
+            known: Items from the previous fetch of this feed, by id; an entry
+                with a known id reuses that item instead of being re-parsed
+        
+        Returns:
+            Parsed items; entries that fail to parse are skipped
+        """
+        items: List[NewsItem] = []
+        for entry in entries:
+            try:
+                news_id = generate_news_id(entry.get("title", "").strip(), source)
+                item = known.get(news_id) if known else None
+                items.append(item or self._parse_entry(entry, source, news_id))
+            except Exception as e:
+                logger.warning(
+                    "Failed to parse RSS entry",
+                    source=source,
+                    error=str(e),
+                )
+                continue
+            if len(items) >= MAX_ENTRIES_PER_FEED:
+                break
+        return items
+    
+    @staticmethod
+    def _iter_entries_stream(content: bytes):
+        """
+        Stream RSS <item> / Atom <entry> elements out of a feed document.
+        
+        Each entry is yielded as a dict with the feedparser keys used by
+        _parse_entry, then cleared so the tree never holds the whole feed.
+        Stopping iteration early leaves the rest of the document unparsed.
+        
+        Args:
+            content: Raw feed bytes
+        
+        Yields:
+            Dict of entry fields (title, link, published, updated, summary)
+        
+        Raises:
+            ET.ParseError: If the document is not well-formed XML
+        """
+        for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+            # Strip any namespace: "{http://www.w3.org/2005/Atom}entry" -> "entry"
+            tag = elem.tag.rpartition("}")[2]
+            if tag != "item" and tag != "entry":
+                continue
+            
+            entry: Dict[str, str] = {}
+            for child in elem:
+                key = _ENTRY_FIELDS.get(child.tag.rpartition("}")[2])
+                if key is None or key in entry:
+                    continue
+                if key == "link" and not (child.text or "").strip():
+                    # Atom: <link href="..."/>; keep the first (alternate) link
+                    if child.get("rel", "alternate") != "alternate":
+                        continue
+                    value = child.get("href", "")
+                else:
+                    value = "".join(child.itertext()).strip()
+                entry[key] = value
+            elem.clear()
+            yield entry
+    
+    def _parse_entry(self, entry: Any, source: str, news_id: Optional[str] = None) -> NewsItem:
         """
         Parse a feedparser entry to NewsItem.
         
         Args:
             entry: Feedparser entry object
             source: Source name
+            news_id: Precomputed generate_news_id(title, source), if available
         
         Returns:
             NewsItem instance
@@ -226,24 +399,31 @@ class RSSClient:
         title = entry.get("title", "").strip()
         url = entry.get("link", "")
         
-        # Parse publication date
+        # Parse publication date; feedparser entries carry a pre-parsed UTC
+        # struct_time, stream-parsed entries only the raw string
         published_at = None
-        for date_field in ["published", "updated", "created"]:
+        for date_field, parsed_field in _DATE_FIELDS:
+            parsed = entry.get(parsed_field)
+            if parsed:
+                published_at = datetime(*parsed[:6], tzinfo=timezone.utc)
+                break
             if date_field in entry:
                 published_at = parse_rss_date(entry[date_field])
                 if published_at:
                     break
         
         # Generate unique ID
-        news_id = generate_news_id(title, source)
+        if news_id is None:
+            news_id = generate_news_id(title, source)
         
-        # Extract summary if available
-        summary = None
-        if "summary" in entry:
-            summary = entry.summary[:500] if entry.summary else None
+        # Extract summary if available; slicing a summary that is already short
+        # enough returns the same object, so only long ones are copied
+        summary = entry.get("summary") or None
+        if summary:
+            summary = summary[:MAX_SUMMARY_CHARS]
         
         # Detect symbol in title
-        detected_symbol = extract_symbol_from_text(title, SUPPORTED_SYMBOLS)
+        detected_symbol = extract_symbol_from_text(title, SUPPORTED_SYMBOLS, ALIAS_TO_SYMBOL)
         
         return NewsItem(
             id=news_id,
@@ -255,7 +435,7 @@ class RSSClient:
             summary=summary,
         )
     
-    def fetch_crypto_news(self, sources: Dict[str, str] = None) -> List[NewsItem]:
+    def fetch_crypto_news(self, sources: Mapping[str, str] = None) -> List[NewsItem]:
         """
         Fetch news from all crypto RSS feeds.
         
@@ -268,32 +448,40 @@ class RSSClient:
         if sources is None:
             sources = RSS_FEEDS
         
-        all_items: List[NewsItem] = []
+        # Each feed's items are cached newest first; merged at the end
+        per_feed: List[List[NewsItem]] = []
         
-        # Fetch feeds in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._fetch_feed, source, url): source
-                for source, url in sources.items()
-            }
-            
-            for future in as_completed(futures):
-                source = futures[future]
-                try:
-                    result = future.result()
-                    all_items.extend(result.items)
-                except Exception as e:
-                    logger.error(
-                        "Feed fetch failed",
-                        source=source,
-                        error=str(e),
-                    )
-        
-        # Sort by published date (newest first)
-        all_items.sort(
-            key=lambda x: x.published_at or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True,
-        )
+        # Serve still-cached feeds inline; only the rest need a network fetch
+        to_fetch: Dict[str, str] = {}
+        for source, url in sources.items():
+            cached = self._get_cached(source)
+            if cached is not None:
+                per_feed.append(cached)
+            else:
+                to_fetch[source] = url
+        
+        # Fetch the remaining feeds in parallel, one thread each up to max_workers
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(to_fetch))) as executor:
+                futures = {
+                    executor.submit(self._fetch_feed, source, url): source
+                    for source, url in to_fetch.items()
+                }
+                
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        result = future.result()
+                        per_feed.append(result.items)
+                    except Exception as e:
+                        logger.error(
+                            "Feed fetch failed",
+                            source=source,
+                            error=str(e),
+                        )
+        
+        # k-way merge of the per-feed lists (newest first)
+        all_items = list(heapq.merge(*per_feed, key=_published_key, reverse=True))
         
         logger.info(
             "Crypto news fetch complete",
@@ -331,13 +519,13 @@ class RSSClient:
         """
         all_news = self.fetch_crypto_news()
         
-        # Filter by age
+        # Filter by age; the list is newest first, so stop at the first older item
         if max_age_hours:
-            cutoff = datetime.now(timezone.utc).timestamp() - (max_age_hours * 3600)
-            all_news = [
-                n for n in all_news
-                if n.published_at and n.published_at.timestamp() > cutoff
-            ]
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+            all_news = list(takewhile(
+                lambda n: n.published_at is not None and n.published_at > cutoff,
+                all_news,
+            ))
         
         # Filter by symbol if specified
         if symbols:
@@ -348,6 +536,10 @@ class RSSClient:
         
         return all_news
     
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+    
     def clear_cache(self) -> None:
         """Clear the RSS cache."""
         self._cache.clear()
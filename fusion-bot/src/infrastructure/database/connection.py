@@ -5,11 +5,13 @@ Database Connection Manager for FusionBot
 PostgreSQL connection management with SQLAlchemy.
 """
 
+import re
+import threading
 from contextlib import contextmanager
 from functools import lru_cache
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, make_url, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
@@ -19,6 +21,19 @@ from src.infrastructure.database.models import Base
 
 logger = get_logger(__name__)
 
+# "user:password@" credentials in a database URL
+_URL_PW_RE = re.compile(r':([^@]+)@')
+
+# SQLAlchemy dialect+driver for PostgreSQL (psycopg 3)
+POSTGRES_DRIVERNAME = "postgresql+psycopg"
+
+# PostgreSQL session options: the bot only runs short OLTP queries, where JIT
+# compilation costs more than it saves
+POSTGRES_CONNECT_ARGS = {"options": "-c jit=off"}
+
+# Recycle pooled connections before server/proxy idle timeouts drop them
+POOL_RECYCLE_SECONDS = 1500
+
 
 class DatabaseManager:
     """
@@ -33,22 +48,34 @@ class DatabaseManager:
             ...
     """
     
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, pool_size: int = 5, max_overflow: int = 10):
         """
         Initialize database manager.
         
         Args:
             database_url: PostgreSQL connection URL
+            pool_size: Connections kept open in the pool
+            max_overflow: Extra connections allowed during bursts
         """
         self.database_url = database_url
+        url = make_url(database_url)
+        is_postgres = url.get_backend_name() == "postgresql"
+        if url.drivername == "postgresql":
+            # A bare postgresql:// URL would select psycopg2, which isn't installed;
+            # use psycopg 3 (the driver in requirements.txt)
+            url = url.set(drivername=POSTGRES_DRIVERNAME)
         
-        # Create engine with connection pooling
+        # Create engine with connection pooling. SQLAlchemy 2.0 already batches
+        # executemany INSERTs (insertmanyvalues) and caches compiled statements.
         self.engine = create_engine(
-            database_url,
+            url,
             poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_use_lifo=True,  # Reuse the most recent (warm) connection first
+            pool_recycle=POOL_RECYCLE_SECONDS,
             pool_pre_ping=True,  # Verify connections before use
+            connect_args=POSTGRES_CONNECT_ARGS if is_postgres else {},
             echo=False,  # Set True for SQL debugging
         )
         
@@ -64,8 +91,7 @@ class DatabaseManager:
     
     def _mask_url(self, url: str) -> str:
         """Mask password in database URL for logging."""
-        import re
-        return re.sub(r':([^@]+)@', ':***@', url)
+        return _URL_PW_RE.sub(':***@', url)
     
     def init_db(self) -> None:
         """
@@ -75,7 +101,19 @@ class DatabaseManager:
         recreate existing tables.
         """
         logger.info("Initializing database tables...")
-        Base.metadata.create_all(bind=self.engine)
+        try:
+            Base.metadata.create_all(bind=self.engine)
+        except Exception as e:
+            logger.error("Failed to initialize database", error=str(e))
+            # Send notification for database initialization failure (lazy import to avoid circular dependency)
+            from src.services.notifier import get_notifier
+            notifier = get_notifier()
+            if notifier:
+                notifier.send_system_failure(
+                    component="Database Initialization",
+                    error=f"Failed to initialize: {str(e)[:200]}",
+                )
+            raise
         logger.info("Database tables initialized successfully")
     
     def drop_all(self) -> None:
@@ -165,13 +203,15 @@ class DatabaseManager:
 
 # Global database manager instance
 _db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
 
 
 def get_db_manager() -> DatabaseManager:
     """
     Get the global database manager instance.
     
-    Lazily initializes on first call.
+    Lazily creates it on first call (thread-safe). Schema creation is not
+    done here: entrypoints that need it call init_db() once at startup.
     
     Returns:
         DatabaseManager instance
@@ -179,21 +219,14 @@ def get_db_manager() -> DatabaseManager:
     global _db_manager
     
     if _db_manager is None:
-        settings = get_settings()
-        try:
-            _db_manager = DatabaseManager(settings.database_url)
-            _db_manager.init_db()
-        except Exception as e:
-            logger.error("Failed to initialize database", error=str(e))
-            # Send notification for database initialization failure (lazy import to avoid circular dependency)
-            from src.services.notifier import get_notifier
-            notifier = get_notifier()
-            if notifier:
-                notifier.send_system_failure(
-                    component="Database Initialization",
-                    error=f"Failed to initialize: {str(e)[:200]}",
+        with _db_manager_lock:
+            if _db_manager is None:
+                settings = get_settings()
+                _db_manager = DatabaseManager(
+                    settings.database_url,
+                    pool_size=settings.db_pool_size,
+                    max_overflow=settings.db_max_overflow,
                 )
-            raise
     
     return _db_manager
 
@@ -18,6 +18,7 @@ from sqlalchemy import (
     Text,
     Index,
     ForeignKey,
+    text,
 )
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -105,9 +106,19 @@ class TradeORM(Base):
     news = relationship("SeenNewsORM", back_populates="trades")
     
     __table_args__ = (
-        Index("idx_trades_status", "status"),
         Index("idx_trades_opened_at", "opened_at"),
         Index("idx_trades_symbol", "symbol"),
+        # Open-position lookups by symbol; only a handful of rows are ever open
+        Index(
+            "idx_trades_open_symbol",
+            "symbol",
+            postgresql_where=text("status IN ('OPEN', 'PENDING')"),
+            sqlite_where=text("status IN ('OPEN', 'PENDING')"),
+        ),
+        # Performance stats: closed trades within a date range
+        Index("idx_trades_status_closed_at", "status", "closed_at"),
+        # Zombie sweep: open trades older than a cutoff
+        Index("idx_trades_status_opened_at", "status", "opened_at"),
     )
     
     def __repr__(self) -> str:
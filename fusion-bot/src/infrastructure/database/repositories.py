@@ -5,11 +5,15 @@ Repository Pattern for FusionBot
 Data access layer abstracting database operations.
 """
 
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Sequence, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
+from sqlalchemy import desc, and_, event, exists, func, case, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from src.core.enums import TradeStatus, ExitReason
 from src.core.models import NewsItem, Position
@@ -25,15 +29,75 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Dialect INSERT constructs that support ON CONFLICT
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+# Trade statuses that still hold (or are acquiring) a position
+_ACTIVE_STATUSES = (TradeStatus.OPEN.value, TradeStatus.PENDING.value)
+
+# (news item, action taken, rejection reason)
+SeenNewsEntry = Tuple[NewsItem, str, Optional[str]]
+
+# News IDs remembered in-process by NewsRepository (seen_news rows are never deleted)
+SEEN_CACHE_SIZE = 10_000
+
+# Session.info key for seen IDs waiting on their transaction to commit
+_PENDING_SEEN_KEY = "pending_seen_news_ids"
+
 
 class NewsRepository:
     """
     Repository for news item operations.
+    
+    Seen IDs are kept in a bounded LRU shared by all instances, so repeat
+    checks for recent headlines skip the database. IDs only enter it once
+    the session that wrote or read them commits, so a rolled-back mark
+    is never reported as seen.
     """
     
+    _seen_cache: "OrderedDict[str, None]" = OrderedDict()
+    _seen_cache_lock = threading.Lock()
+    
     def __init__(self, session: Session):
         self.session = session
     
+    @classmethod
+    def _remember_seen(cls, news_ids: Iterable[str]) -> None:
+        """Add IDs to the seen cache, evicting the least recently used."""
+        with cls._seen_cache_lock:
+            for news_id in news_ids:
+                cls._seen_cache[news_id] = None
+                cls._seen_cache.move_to_end(news_id)
+            while len(cls._seen_cache) > SEEN_CACHE_SIZE:
+                cls._seen_cache.popitem(last=False)
+    
+    @classmethod
+    def _commit_pending_seen(cls, session: Session) -> None:
+        """after_commit hook: move the session's pending IDs into the cache."""
+        pending = session.info.get(_PENDING_SEEN_KEY)
+        if pending:
+            cls._remember_seen(pending)
+            pending.clear()
+    
+    @staticmethod
+    def _discard_pending_seen(session: Session) -> None:
+        """after_rollback hook: forget IDs whose transaction was undone."""
+        pending = session.info.get(_PENDING_SEEN_KEY)
+        if pending:
+            pending.clear()
+    
+    def _remember_on_commit(self, news_ids: Iterable[str]) -> None:
+        """Queue IDs for the seen cache until this session commits."""
+        pending = self.session.info.get(_PENDING_SEEN_KEY)
+        if pending is None:
+            pending = self.session.info[_PENDING_SEEN_KEY] = set()
+            event.listen(self.session, "after_commit", self._commit_pending_seen)
+            event.listen(self.session, "after_rollback", self._discard_pending_seen)
+        pending.update(news_ids)
+    
     def is_seen(self, news_id: str) -> bool:
         """
         Check if a news item has already been processed.
@@ -44,10 +108,18 @@ class NewsRepository:
         Returns:
             True if news was already processed
         """
-        exists = self.session.query(SeenNewsORM).filter(
-            SeenNewsORM.id == news_id
-        ).first()
-        return exists is not None
+        with self._seen_cache_lock:
+            if news_id in self._seen_cache:
+                self._seen_cache.move_to_end(news_id)
+                return True
+        
+        # Core EXISTS: no row is fetched or hydrated into an ORM object
+        seen = self.session.execute(
+            select(exists().where(SeenNewsORM.id == news_id))
+        ).scalar()
+        if seen:
+            self._remember_on_commit((news_id,))
+        return seen
     
     def mark_seen(
         self,
@@ -58,26 +130,15 @@ class NewsRepository:
         """
         Mark a news item as processed.
         
+        Single-row form of mark_seen_many: one upsert statement, no
+        SELECT beforehand as merge() would need.
+        
         Args:
             news_item: The news item to mark
             action_taken: What action was taken (BUY, WAIT, REJECTED)
             rejection_reason: If rejected, why
         """
-        record = SeenNewsORM(
-            id=news_item.id,
-            title=news_item.title,
-            source=news_item.source,
-            url=news_item.url,
-            published_at=news_item.published_at,
-            processed_at=datetime.now(timezone.utc),
-            detected_symbol=news_item.detected_symbol,
-            action_taken=action_taken,
-            rejection_reason=rejection_reason,
-        )
-        
-        # Use merge to handle potential duplicates gracefully
-        self.session.merge(record)
-        self.session.flush()
+        self._upsert_seen([(news_item, action_taken, rejection_reason)])
         
         logger.debug(
             "News marked as seen",
@@ -85,6 +146,62 @@ class NewsRepository:
             action=action_taken,
         )
     
+    def mark_seen_many(self, entries: Sequence[SeenNewsEntry]) -> None:
+        """
+        Mark several news items as processed in one statement.
+        
+        Args:
+            entries: (news_item, action_taken, rejection_reason) tuples;
+                if an item appears more than once, the last entry wins
+        """
+        if not entries:
+            return
+        
+        count = self._upsert_seen(entries)
+        
+        logger.debug("News batch marked as seen", count=count)
+    
+    def _upsert_seen(self, entries: Sequence[SeenNewsEntry]) -> int:
+        """
+        INSERT ... ON CONFLICT (id) DO UPDATE the given entries.
+        
+        DO UPDATE rather than DO NOTHING: an item can be re-marked within
+        a cycle (e.g. SELECTED then EXECUTION_FAILED) and the later action
+        must win.
+        
+        Returns:
+            Number of distinct rows written
+        """
+        processed_at = datetime.now(timezone.utc)
+        rows = {
+            news_item.id: {
+                "id": news_item.id,
+                "title": news_item.title,
+                "source": news_item.source,
+                "url": news_item.url,
+                "published_at": news_item.published_at,
+                "processed_at": processed_at,
+                "detected_symbol": news_item.detected_symbol,
+                "action_taken": action_taken,
+                "rejection_reason": rejection_reason,
+            }
+            for news_item, action_taken, rejection_reason in entries
+        }
+        
+        insert = _UPSERT_INSERTS[self.session.get_bind().dialect.name]
+        stmt = insert(SeenNewsORM)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SeenNewsORM.id],
+            set_={
+                "processed_at": stmt.excluded.processed_at,
+                "action_taken": stmt.excluded.action_taken,
+                "rejection_reason": stmt.excluded.rejection_reason,
+            },
+        )
+        self.session.execute(stmt, list(rows.values()))
+        self._remember_on_commit(rows.keys())
+        return len(rows)
+    
     def get_recent(self, hours: int = 24, limit: int = 100) -> List[SeenNewsORM]:
         """
         Get recently processed news items.
@@ -104,9 +221,11 @@ class NewsRepository:
     def count_today(self) -> int:
         """Get count of news processed today."""
         today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        return self.session.query(SeenNewsORM).filter(
-            SeenNewsORM.processed_at >= today_start
-        ).count()
+        return self.session.execute(
+            select(func.count()).select_from(SeenNewsORM).where(
+                SeenNewsORM.processed_at >= today_start
+            )
+        ).scalar_one()
 
 
 class TradeRepository:
@@ -175,7 +294,7 @@ class TradeRepository:
     def get_open_trades(self) -> List[TradeORM]:
         """Get all open trades."""
         return self.session.query(TradeORM).filter(
-            TradeORM.status.in_([TradeStatus.OPEN.value, TradeStatus.PENDING.value])
+            TradeORM.status.in_(_ACTIVE_STATUSES)
         ).all()
     
     def get_open_by_symbol(self, symbol: str) -> Optional[TradeORM]:
@@ -183,22 +302,24 @@ class TradeRepository:
         return self.session.query(TradeORM).filter(
             and_(
                 TradeORM.symbol == symbol,
-                TradeORM.status.in_([TradeStatus.OPEN.value, TradeStatus.PENDING.value])
+                TradeORM.status.in_(_ACTIVE_STATUSES)
             )
         ).first()
     
-    def count_open(self) -> int:
-        """Count open positions across all symbols."""
-        return self.session.query(TradeORM).filter(
-            TradeORM.status.in_([TradeStatus.OPEN.value, TradeStatus.PENDING.value])
-        ).count()
-    
-    def count_open_by_symbol(self, symbol: str) -> int:
-        """Count open positions for a specific symbol."""
-        return self.session.query(TradeORM).filter(
-            TradeORM.symbol == symbol,
-            TradeORM.status.in_([TradeStatus.OPEN.value, TradeStatus.PENDING.value])
-        ).count()
+    def get_open_summary(self) -> Dict[str, int]:
+        """
+        Count open positions per symbol in a single GROUP BY query.
+        
+        Returns:
+            Mapping of symbol to open position count (open symbols only);
+            sum the values for the total
+        """
+        rows = self.session.execute(
+            select(TradeORM.symbol, func.count()).where(
+                TradeORM.status.in_(_ACTIVE_STATUSES)
+            ).group_by(TradeORM.symbol)
+        ).all()
+        return dict(rows)
     
     def close_trade(
         self,
@@ -290,14 +411,20 @@ class TradeRepository:
     def get_performance_stats(self, days: int = 30) -> Dict[str, Any]:
         """Get trading performance statistics."""
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        trades = self.session.query(TradeORM).filter(
+        
+        # Reduced in the database: one aggregate row, no ORM objects
+        total, wins, total_pnl = self.session.query(
+            func.count(TradeORM.id),
+            func.coalesce(func.sum(case((TradeORM.pnl_percent > 0, 1), else_=0)), 0),
+            func.coalesce(func.sum(TradeORM.pnl_percent), 0.0),
+        ).filter(
             and_(
                 TradeORM.status == TradeStatus.CLOSED.value,
                 TradeORM.closed_at >= cutoff
             )
-        ).all()
+        ).one()
         
-        if not trades:
+        if not total:
             return {
                 "total_trades": 0,
                 "wins": 0,
@@ -307,17 +434,13 @@ class TradeRepository:
                 "avg_pnl_percent": 0.0,
             }
         
-        wins = [t for t in trades if (t.pnl_percent or 0) > 0]
-        losses = [t for t in trades if (t.pnl_percent or 0) <= 0]
-        total_pnl = sum(t.pnl_percent or 0 for t in trades)
-        
         return {
-            "total_trades": len(trades),
-            "wins": len(wins),
-            "losses": len(losses),
-            "win_rate": len(wins) / len(trades) if trades else 0,
+            "total_trades": total,
+            "wins": wins,
+            "losses": total - wins,
+            "win_rate": wins / total,
             "total_pnl_percent": total_pnl,
-            "avg_pnl_percent": total_pnl / len(trades) if trades else 0,
+            "avg_pnl_percent": total_pnl / total,
         }
 
 
@@ -383,10 +506,10 @@ class SystemStateRepository:
     
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get a state value."""
-        record = self.session.query(SystemStateORM).filter(
-            SystemStateORM.key == key
-        ).first()
-        return record.value if record else default
+        value = self.session.execute(
+            select(SystemStateORM.value).where(SystemStateORM.key == key)
+        ).scalar_one_or_none()
+        return value if value is not None else default
     
     def set(self, key: str, value: str) -> None:
         """Set a state value."""
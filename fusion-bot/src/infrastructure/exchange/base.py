@@ -7,7 +7,7 @@ Abstract base class defining the exchange API contract.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
 
@@ -48,6 +48,33 @@ class Ticker:
     last: float
     volume: float
     timestamp: datetime
+    
+    @classmethod
+    def from_ccxt(
+        cls,
+        symbol: str,
+        data: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
+    ) -> "Ticker":
+        """
+        Convert a CCXT ticker dict to a Ticker.
+        
+        CCXT often returns bid/ask/quoteVolume as None rather than
+        omitting them, so missing and None values both become 0.
+        
+        Args:
+            symbol: Trading pair
+            data: Ticker dict from fetch_ticker/fetch_tickers
+            timestamp: Receive time; defaults to now (pass one for a batch)
+        """
+        return cls(
+            symbol=symbol,
+            bid=float(data.get("bid") or 0),
+            ask=float(data.get("ask") or 0),
+            last=float(data.get("last") or 0),
+            volume=float(data.get("quoteVolume") or 0),
+            timestamp=timestamp or datetime.now(timezone.utc),
+        )
 
 
 @dataclass
@@ -96,6 +123,21 @@ class ExchangeInterface(ABC):
         """
         pass
     
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """
+        Get current tickers for several symbols.
+        
+        Implementations should override this with a single batched
+        request where the exchange supports it.
+        
+        Args:
+            symbols: Trading pairs (e.g., ['BTC/USDC', 'ETH/USDC'])
+        
+        Returns:
+            Dict mapping symbol to Ticker
+        """
+        return {symbol: self.get_ticker(symbol) for symbol in symbols}
+    
     @abstractmethod
     def get_ohlcv(
         self,
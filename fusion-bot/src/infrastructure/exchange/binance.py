@@ -188,18 +188,24 @@ class BinanceClient(ExchangeInterface):
         try:
             # Use public exchange for real market data (even on testnet)
             ticker = self._public_exchange.fetch_ticker(symbol)
-            
-            return Ticker(
-                symbol=symbol,
-                bid=float(ticker.get("bid", 0) or 0),
-                ask=float(ticker.get("ask", 0) or 0),
-                last=float(ticker.get("last", 0) or 0),
-                volume=float(ticker.get("quoteVolume", 0) or 0),
-                timestamp=datetime.now(timezone.utc),
-            )
+            return Ticker.from_ccxt(symbol, ticker)
         except Exception as e:
             self._handle_error(e, "get_ticker")
     
+    @with_retry(RetryConfig(max_attempts=3))
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """Get tickers for several symbols in one request (public data)."""
+        try:
+            tickers = self._public_exchange.fetch_tickers(symbols)
+            now = datetime.now(timezone.utc)
+            return {
+                symbol: Ticker.from_ccxt(symbol, tickers[symbol], now)
+                for symbol in symbols
+                if symbol in tickers
+            }
+        except Exception as e:
+            self._handle_error(e, "get_tickers")
+    
     @with_retry(RetryConfig(max_attempts=3))
     def get_ohlcv(
         self,
@@ -125,14 +125,7 @@ class PaperExchange(ExchangeInterface):
         try:
             ccxt_client = self._get_ccxt()
             ticker_data = ccxt_client.fetch_ticker(symbol)
-            return Ticker(
-                symbol=symbol,
-                bid=float(ticker_data.get("bid", 0)),
-                ask=float(ticker_data.get("ask", 0)),
-                last=float(ticker_data.get("last", 0)),
-                volume=float(ticker_data.get("quoteVolume", 0)),
-                timestamp=datetime.now(timezone.utc),
-            )
+            return Ticker.from_ccxt(symbol, ticker_data)
         except Exception as e:
             logger.error(f"Failed to get ticker for {symbol}: {e}")
             # Fallback to mock prices for testing
@@ -147,6 +140,22 @@ class PaperExchange(ExchangeInterface):
                 timestamp=datetime.now(timezone.utc),
             )
     
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """Get real tickers for several symbols in one request."""
+        try:
+            ccxt_client = self._get_ccxt()
+            tickers_data = ccxt_client.fetch_tickers(symbols)
+            now = datetime.now(timezone.utc)
+            return {
+                symbol: Ticker.from_ccxt(symbol, data, now)
+                for symbol, data in tickers_data.items()
+                if symbol in symbols
+            }
+        except Exception as e:
+            logger.error(f"Failed to get tickers for {symbols}: {e}")
+            # Per-symbol path applies the mock price fallback
+            return super().get_tickers(symbols)
+    
     def get_ohlcv(
         self,
         symbol: str,
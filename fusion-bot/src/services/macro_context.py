@@ -14,7 +14,6 @@ Philosophy:
 Replaces the old binary MacroGuard approach.
 """
 
-import re
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
@@ -24,6 +23,7 @@ from src.infrastructure.database import get_session
 from src.infrastructure.database.repositories import MacroEventRepository
 from src.config import get_settings
 from src.config.constants import MACRO_RSS_FEEDS
+from src.utils.helpers import compile_keyword_pattern, find_keywords
 from src.utils.logging import get_logger
 from src.utils.classification_cache import ClassificationCache
 from src.services.notifier import get_notifier
@@ -75,6 +75,10 @@ MACRO_CONTEXT_KEYWORDS = [
     "liquidation", "capitulation",
 ]
 
+# Each list compiled once so a headline is scanned in a single regex pass
+_CATASTROPHE_PATTERN = compile_keyword_pattern(CATASTROPHE_KEYWORDS)
+_MACRO_CONTEXT_PATTERN = compile_keyword_pattern(MACRO_CONTEXT_KEYWORDS)
+
 
 @dataclass
 class MacroHeadline:
@@ -201,24 +205,15 @@ class MacroContext:
             is_catastrophe = self.catastrophe_classifier.is_catastrophe(headline)
             if is_catastrophe:
                 # Classifier says it's a catastrophe - extract keyword for logging
-                headline_lower = headline.lower()
-                for keyword in CATASTROPHE_KEYWORDS:
-                    pattern = r'\b' + re.escape(keyword) + r'\b'
-                    if re.search(pattern, headline_lower):
-                        result = keyword
-                        break
+                matched = find_keywords(_CATASTROPHE_PATTERN, CATASTROPHE_KEYWORDS, headline)
                 # If classifier says catastrophe but no keyword match, return generic
-                if result is None:
-                    result = "catastrophe_detected"
+                result = matched[0] if matched else "catastrophe_detected"
             # else: result stays None (not a catastrophe)
         else:
             # Fallback to keyword matching ONLY if classifier unavailable
-            headline_lower = headline.lower()
-            for keyword in CATASTROPHE_KEYWORDS:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, headline_lower):
-                    result = keyword
-                    break
+            matched = find_keywords(_CATASTROPHE_PATTERN, CATASTROPHE_KEYWORDS, headline)
+            if matched:
+                result = matched[0]
         
         # Step 4: Cache the result
         self.cache.set_classification(headline, result)
@@ -245,13 +240,7 @@ class MacroContext:
             return cached_keywords
         
         # Compute keywords (not cached or expired)
-        headline_lower = headline.lower()
-        found = []
-        
-        for keyword in MACRO_CONTEXT_KEYWORDS:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, headline_lower):
-                found.append(keyword)
+        found = find_keywords(_MACRO_CONTEXT_PATTERN, MACRO_CONTEXT_KEYWORDS, headline)
         
         # Cache the result
         self.cache.set_context_keywords(headline, found)
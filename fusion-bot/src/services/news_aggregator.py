@@ -7,13 +7,13 @@ Handles deduplication and symbol detection.
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from src.core.models import NewsItem
 from src.core.exceptions import NewsParsingError
 from src.infrastructure.clients.rss_client import RSSClient
 from src.infrastructure.database import get_session
-from src.infrastructure.database.repositories import NewsRepository
+from src.infrastructure.database.repositories import NewsRepository, SeenNewsEntry
 from src.config import get_settings
 from src.config.constants import SUPPORTED_SYMBOLS
 from src.utils.logging import get_logger
@@ -53,7 +53,7 @@ class NewsAggregator:
             cache_seconds=self.settings.rss_cache_seconds
         )
         self.max_age_hours = max_age_hours
-        self.watchlist = self.settings.watchlist_symbols
+        self.watchlist = self.settings.watchlist
         
         logger.info(
             "News aggregator initialized",
@@ -223,6 +223,22 @@ class NewsAggregator:
             action=action,
         )
     
+    def mark_processed_many(self, entries: Sequence[SeenNewsEntry]) -> None:
+        """
+        Mark several news items as processed in one database round trip.
+        
+        Args:
+            entries: (news_item, action, rejection_reason) tuples
+        """
+        if not entries:
+            return
+        
+        with get_session() as session:
+            repo = NewsRepository(session)
+            repo.mark_seen_many(entries)
+        
+        logger.debug("News batch marked as processed", count=len(entries))
+    
     def get_stats(self) -> dict:
         """Get news processing statistics."""
         with get_session() as session:
@@ -6,11 +6,14 @@ Sends critical alerts via Telegram.
 Only sends: Critical events, Financial events, System failures, Important trade events.
 """
 
+import atexit
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config import get_settings
@@ -18,6 +21,9 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Max kept-alive connections to api.telegram.org per notifier
+TELEGRAM_POOL_SIZE = 4
+
 
 class NotifierInterface(ABC):
     """Abstract interface for notification services."""
@@ -56,6 +62,13 @@ class TelegramNotifier(NotifierInterface):
         self.chat_id = chat_id
         self.api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         self._enabled = bool(bot_token and chat_id)
+        # Shared session keeps the TLS connection to Telegram alive between sends;
+        # the pool allows a few concurrent senders without reopening connections
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=TELEGRAM_POOL_SIZE),
+        )
         
         if not self._enabled:
             logger.warning("Telegram notifier disabled - missing bot_token or chat_id")
@@ -80,7 +93,7 @@ class TelegramNotifier(NotifierInterface):
             emoji = self._get_emoji(priority)
             formatted_message = f"{emoji} {message}"
             
-            response = requests.post(
+            response = self._session.post(
                 self.api_url,
                 json={
                     "chat_id": self.chat_id,
@@ -98,6 +111,10 @@ class TelegramNotifier(NotifierInterface):
             logger.error("Failed to send Telegram notification", error=str(e), priority=priority)
             return False
     
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self._session.close()
+    
     def _get_emoji(self, priority: str) -> str:
         """Get emoji for priority level."""
         emoji_map = {
@@ -217,10 +234,13 @@ class TelegramNotifier(NotifierInterface):
         return self.send(message, priority="CRITICAL")
 
 
+@lru_cache()
 def get_notifier() -> Optional[TelegramNotifier]:
     """
     Get configured notifier instance.
     
+    Cached so every caller shares one notifier and its HTTP session.
+    
     Returns:
         TelegramNotifier if configured, None otherwise
     """
@@ -229,8 +249,10 @@ def get_notifier() -> Optional[TelegramNotifier]:
     if not settings.telegram_bot_token or not settings.telegram_chat_id:
         return None
     
-    return TelegramNotifier(
+    notifier = TelegramNotifier(
         bot_token=settings.telegram_bot_token,
         chat_id=settings.telegram_chat_id,
     )
+    atexit.register(notifier.close)
+    return notifier
 
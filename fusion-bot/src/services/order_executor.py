@@ -88,25 +88,26 @@ class OrderExecutor:
         - Total limit (max positions across all symbols)
         """
         with get_session() as session:
-            repo = TradeRepository(session)
-            
-            # Check per-symbol limit
-            symbol_count = repo.count_open_by_symbol(symbol)
-            if symbol_count >= self.max_positions_per_symbol:
-                raise PositionLimitError(
-                    symbol_count,
-                    self.max_positions_per_symbol,
-                    f"Max positions per symbol ({symbol}) reached"
-                )
-            
-            # Check total limit
-            total_count = repo.count_open()
-            if total_count >= self.max_total_positions:
-                raise PositionLimitError(
-                    total_count,
-                    self.max_total_positions,
-                    "Max total positions reached"
-                )
+            # One GROUP BY query serves both limits
+            open_counts = TradeRepository(session).get_open_summary()
+        
+        # Check per-symbol limit
+        symbol_count = open_counts.get(symbol, 0)
+        if symbol_count >= self.max_positions_per_symbol:
+            raise PositionLimitError(
+                symbol_count,
+                self.max_positions_per_symbol,
+                f"Max positions per symbol ({symbol}) reached"
+            )
+        
+        # Check total limit
+        total_count = sum(open_counts.values())
+        if total_count >= self.max_total_positions:
+            raise PositionLimitError(
+                total_count,
+                self.max_total_positions,
+                "Max total positions reached"
+            )
     
     def _get_available_balance(self, symbol: str) -> float:
         """
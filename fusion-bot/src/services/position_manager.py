@@ -7,7 +7,7 @@ Handles virtual SL/TP, time decay, and exchange sync.
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.core.models import Position
 from src.core.enums import TradeStatus, TradeSide, ExitReason
@@ -93,19 +93,24 @@ class PositionManager:
             trades = repo.get_open_trades()
             return [self._trade_to_position(t) for t in trades]
     
-    def check_virtual_targets(self, position: Position) -> Optional[Tuple[ExitReason, float]]:
+    def check_virtual_targets(
+        self,
+        position: Position,
+        current_price: Optional[float] = None,
+    ) -> Optional[Tuple[ExitReason, float]]:
         """
         Check if virtual SL or TP is hit.
         
         Args:
             position: Position to check
+            current_price: Prefetched last price; fetched from the exchange if None
         
         Returns:
             Tuple of (ExitReason, trigger_price) if target hit, None otherwise
         """
         try:
-            ticker = self.exchange.get_ticker(position.symbol)
-            current_price = ticker.last
+            if current_price is None:
+                current_price = self.exchange.get_ticker(position.symbol).last
             
             if position.check_virtual_sl(current_price):
                 logger.warning(
@@ -137,17 +142,18 @@ class PositionManager:
             )
             return None
     
-    def check_time_decay(self, position: Position) -> bool:
+    def check_time_decay(self, position: Position, now: Optional[datetime] = None) -> bool:
         """
         Check if position has exceeded max duration.
         
         Args:
             position: Position to check
+            now: Reference time (UTC), shared across a batch of checks
         
         Returns:
             True if position is a "zombie" (too old)
         """
-        age_hours = position.age_hours
+        age_hours = position.get_age_hours(now)
         is_zombie = age_hours > self.max_trade_duration_hours
         
         if is_zombie:
@@ -349,13 +355,23 @@ class PositionManager:
                 error=str(e),
             )
     
-    def check_position(self, position: Position) -> None:
+    def check_position(
+        self,
+        position: Position,
+        now: Optional[datetime] = None,
+        current_price: Optional[float] = None,
+    ) -> None:
         """
         Check a single position for exit conditions.
         
         Args:
             position: Position to check
+            now: Reference time (UTC) for age checks; defaults to the current time
+            current_price: Prefetched last price; fetched from the exchange if None
         """
+        if now is None:
+            now = datetime.utcnow()
+        
         # Priority 1: Sync with exchange (detect catastrophe stop or external close)
         sync_reason, stop_order = self.sync_with_exchange(position)
         if sync_reason:
@@ -405,7 +421,7 @@ class PositionManager:
             return
         
         # Priority 2: Check virtual targets
-        target_result = self.check_virtual_targets(position)
+        target_result = self.check_virtual_targets(position, current_price)
         if target_result:
             target_reason, trigger_price = target_result
             # Pass the trigger price to ensure consistent execution price
@@ -413,7 +429,7 @@ class PositionManager:
             return
         
         # Priority 3: Check time decay
-        if self.check_time_decay(position):
+        if self.check_time_decay(position, now):
             self.close_position(position, ExitReason.TIME_DECAY)
             return
         
@@ -422,7 +438,7 @@ class PositionManager:
             "Position OK",
             trade_id=position.id,
             symbol=position.symbol,
-            age_hours=round(position.age_hours, 2),
+            age_hours=round(position.get_age_hours(now), 2),
         )
     
     def check_all_positions(self) -> int:
@@ -442,11 +458,29 @@ class PositionManager:
         
         logger.info(f"Checking {len(positions)} open positions")
         
+        # One clock read and one ticker request for the whole pass
+        now = datetime.utcnow()
+        prices = self._get_last_prices(positions)
         for position in positions:
-            self.check_position(position)
+            self.check_position(position, now, prices.get(position.symbol))
         
         return len(positions)
     
+    def _get_last_prices(self, positions: List[Position]) -> Dict[str, float]:
+        """
+        Fetch last prices for all position symbols in one batched request.
+        
+        Returns:
+            Dict of symbol to last price; empty on failure, in which case
+            each position falls back to its own ticker request
+        """
+        try:
+            tickers = self.exchange.get_tickers(list({p.symbol for p in positions}))
+        except Exception as e:
+            logger.warning("Batched ticker fetch failed, falling back per position", error=str(e))
+            return {}
+        return {symbol: ticker.last for symbol, ticker in tickers.items()}
+    
     def force_close_all(self, reason: str = "Manual close") -> int:
         """
         Force close all open positions.
@@ -489,9 +523,10 @@ class PositionManager:
             repo = TradeRepository(session)
             stats = repo.get_performance_stats()
         
+        now = datetime.utcnow()
         return {
             "open_positions": len(positions),
-            "positions": [p.to_dict() for p in positions],
+            "positions": [p.to_dict(now) for p in positions],
             "performance_30d": stats,
         }
 
@@ -9,6 +9,7 @@ Main trading strategy with FULL CONTEXT philosophy:
 - Code can veto after AI decision (catastrophes only)
 """
 
+import time
 from typing import Optional, List, Tuple
 from datetime import datetime, timezone
 
@@ -17,7 +18,7 @@ from src.core.enums import TradeAction, SystemMode, TradeSide, TradeStatus, News
 from src.core.exceptions import PositionLimitError
 from src.infrastructure.exchange.base import ExchangeInterface
 from src.infrastructure.database import get_session
-from src.infrastructure.database.repositories import TradeRepository
+from src.infrastructure.database.repositories import TradeRepository, SeenNewsEntry
 from src.services.news_aggregator import NewsAggregator
 from src.services.macro_context import MacroContext  # NEW: Context, not Guard
 from src.services.technical_analyzer import TechnicalAnalyzer
@@ -184,6 +185,8 @@ class FusionStrategy:
         self._last_trade_time: Optional[datetime] = None
         self._cycle_count = 0
         self._cached_macro_climate: Optional[str] = None
+        self._last_health: Optional[dict] = None
+        self._last_health_at: float = 0.0  # time.monotonic() of last check
         
         logger.info("Fusion strategy initialized (macro-aware AI mode)")
     
@@ -258,6 +261,8 @@ class FusionStrategy:
         """
         opportunities = []
         rejected_count = 0
+        # Rejections are written in one batch once evaluation finishes
+        rejected: List[SeenNewsEntry] = []
         
         # Get current positions to check per-symbol limits
         current_positions = self.position_manager.get_open_positions()
@@ -274,85 +279,89 @@ class FusionStrategy:
         
         logger.info(f"Evaluating {len(news_items)} news items")
         
-        # Get unique symbols from news
-        symbols_needed = set()
-        news_by_symbol: dict[str, List[NewsItem]] = {}
-        
-        for news in news_items:
-            symbol = news.detected_symbol
-            
-            if not symbol:
-                self.news_aggregator.mark_processed(
-                    news, NewsStatus.NO_SYMBOL.value, "No tradeable symbol detected"
-                )
-                continue
-            
-            if symbol not in self.settings.watchlist_symbols:
-                self.news_aggregator.mark_processed(
-                    news, NewsStatus.NOT_IN_WATCHLIST.value, f"Symbol {symbol} not in watchlist"
-                )
-                continue
-            
-            # Check per-symbol position limit
-            current_count = positions_per_symbol.get(symbol, 0)
-            if current_count >= self.settings.max_positions_per_symbol:
-                self.news_aggregator.mark_processed(
-                    news, NewsStatus.POSITION_EXISTS.value, 
-                    f"Max positions per symbol reached: {current_count}/{self.settings.max_positions_per_symbol} for {symbol}"
-                )
-                continue
+        try:
+            # Get unique symbols from news
+            symbols_needed = set()
+            news_by_symbol: dict[str, List[NewsItem]] = {}
             
-            symbols_needed.add(symbol)
-            if symbol not in news_by_symbol:
-                news_by_symbol[symbol] = []
-            news_by_symbol[symbol].append(news)
-        
-        if not symbols_needed:
-            return []
-        
-        # Fetch technicals and check SYMBOL-LEVEL limits ONCE per symbol
-        technicals_cache: dict[str, TechnicalSignals] = {}
-        rejected_symbols: set[str] = set()
-        
-        for symbol in symbols_needed:
-            try:
-                technicals = self.technical_analyzer.analyze(symbol)
+            for news in news_items:
+                symbol = news.detected_symbol
                 
-                # SYMBOL-LEVEL hard limit check (RSI) - run ONCE per symbol
-                is_valid, status, reason = HardLimits.check_symbol(technicals)
+                if not symbol:
+                    rejected.append(
+                        (news, NewsStatus.NO_SYMBOL.value, "No tradeable symbol detected")
+                    )
+                    continue
                 
-                if not is_valid:
-                    # Reject ALL news for this symbol
-                    rejected_symbols.add(symbol)
-                    for news in news_by_symbol[symbol]:
-                        self.news_aggregator.mark_processed(news, status.value, reason)
-                        rejected_count += 1
-                    logger.debug(f"Symbol {symbol} rejected: {reason}")
+                if symbol not in self.settings.watchlist:
+                    rejected.append(
+                        (news, NewsStatus.NOT_IN_WATCHLIST.value, f"Symbol {symbol} not in watchlist")
+                    )
                     continue
                 
-                technicals_cache[symbol] = technicals
+                # Check per-symbol position limit
+                current_count = positions_per_symbol.get(symbol, 0)
+                if current_count >= self.settings.max_positions_per_symbol:
+                    rejected.append((
+                        news, NewsStatus.POSITION_EXISTS.value,
+                        f"Max positions per symbol reached: {current_count}/{self.settings.max_positions_per_symbol} for {symbol}"
+                    ))
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Failed to get technicals for {symbol}: {e}")
-        
-        # Build opportunities, applying NEWS-LEVEL hard limits
-        for symbol, news_list in news_by_symbol.items():
-            if symbol in rejected_symbols or symbol not in technicals_cache:
-                continue
+                symbols_needed.add(symbol)
+                if symbol not in news_by_symbol:
+                    news_by_symbol[symbol] = []
+                news_by_symbol[symbol].append(news)
             
-            technicals = technicals_cache[symbol]
+            if not symbols_needed:
+                return []
             
-            for news in news_list:
-                # NEWS-LEVEL hard limit check (age) - run per news
-                is_valid, status, reason = HardLimits.check_news(news)
-                
-                if not is_valid:
-                    self.news_aggregator.mark_processed(news, status.value, reason)
-                    rejected_count += 1
-                    logger.debug(f"News rejected [{status}]: {reason}")
+            # Fetch technicals and check SYMBOL-LEVEL limits ONCE per symbol
+            technicals_cache: dict[str, TechnicalSignals] = {}
+            rejected_symbols: set[str] = set()
+            
+            for symbol in symbols_needed:
+                try:
+                    technicals = self.technical_analyzer.analyze(symbol)
+                    
+                    # SYMBOL-LEVEL hard limit check (RSI) - run ONCE per symbol
+                    is_valid, status, reason = HardLimits.check_symbol(technicals)
+                    
+                    if not is_valid:
+                        # Reject ALL news for this symbol
+                        rejected_symbols.add(symbol)
+                        for news in news_by_symbol[symbol]:
+                            rejected.append((news, status.value, reason))
+                            rejected_count += 1
+                        logger.debug(f"Symbol {symbol} rejected: {reason}")
+                        continue
+                    
+                    technicals_cache[symbol] = technicals
+                    
+                except Exception as e:
+                    logger.error(f"Failed to get technicals for {symbol}: {e}")
+            
+            # Build opportunities, applying NEWS-LEVEL hard limits
+            for symbol, news_list in news_by_symbol.items():
+                if symbol in rejected_symbols or symbol not in technicals_cache:
                     continue
                 
-                opportunities.append((news, technicals))
+                technicals = technicals_cache[symbol]
+                
+                for news in news_list:
+                    # NEWS-LEVEL hard limit check (age) - run per news
+                    is_valid, status, reason = HardLimits.check_news(news)
+                    
+                    if not is_valid:
+                        rejected.append((news, status.value, reason))
+                        rejected_count += 1
+                        logger.debug(f"News rejected [{status}]: {reason}")
+                        continue
+                    
+                    opportunities.append((news, technicals))
+        finally:
+            # Persist rejections collected so far, even if evaluation raised
+            self.news_aggregator.mark_processed_many(rejected)
         
         logger.info(
             f"Opportunities after hard limits: {len(opportunities)} "
@@ -514,21 +523,20 @@ class FusionStrategy:
                     new_positions.append(position)
                 
                 # Mark other news as COMPARED_OUT - they were evaluated but a better option existed
-                for news, _ in opportunities:
-                    if decision.headline_id and not news.id.startswith(decision.headline_id):
-                        self.news_aggregator.mark_processed(
-                            news, 
-                            NewsStatus.COMPARED_OUT.value, 
-                            f"AI chose {decision.symbol} (headline {decision.headline_id[:8]})"
-                        )
+                if decision.headline_id:
+                    reason = f"AI chose {decision.symbol} (headline {decision.headline_id[:8]})"
+                    self.news_aggregator.mark_processed_many([
+                        (news, NewsStatus.COMPARED_OUT.value, reason)
+                        for news, _ in opportunities
+                        if not news.id.startswith(decision.headline_id)
+                    ])
             else:
                 # AI said WAIT - no good opportunities in this batch
-                for news, _ in opportunities:
-                    self.news_aggregator.mark_processed(
-                        news,
-                        NewsStatus.AI_WAIT.value,
-                        f"AI evaluated batch and said WAIT: {decision.reasoning[:100]}"
-                    )
+                reason = f"AI evaluated batch and said WAIT: {decision.reasoning[:100]}"
+                self.news_aggregator.mark_processed_many([
+                    (news, NewsStatus.AI_WAIT.value, reason)
+                    for news, _ in opportunities
+                ])
             
         except Exception as e:
             logger.error(f"Error in seek_opportunities: {e}")
@@ -592,22 +600,42 @@ class FusionStrategy:
     
     def health_check(self) -> dict:
         """Check all components."""
-        return {
-            "exchange": self.exchange.health_check(),
+        exchange_ok = self.exchange.health_check()
+        self._last_health = {
+            "exchange": exchange_ok,
             "database": True,  # Assume OK if we got here
             "ai": self.trading_brain.test_connection() if self.trading_brain.is_available() else False,
-            "overall": self.exchange.health_check(),
+            "overall": exchange_ok,
         }
+        self._last_health_at = time.monotonic()
+        return self._last_health
     
-    def get_status(self) -> dict:
-        """Get strategy status."""
+    def get_status(self, force: bool = False) -> dict:
+        """
+        Get strategy status.
+        
+        Args:
+            force: Re-run health checks (exchange + AI round-trips) even if
+                a previous result is still fresh
+        
+        A cached health result is reused for one main-loop interval, so
+        frequent status calls don't each hit the exchange and AI.
+        """
+        health_age = time.monotonic() - self._last_health_at
+        if (
+            force
+            or self._last_health is None
+            or health_age >= self.settings.main_loop_interval_seconds
+        ):
+            self.health_check()
+        
         return {
             "mode": str(self._mode),
             "cycle_count": self._cycle_count,
             "last_cycle": self._last_cycle_time.isoformat() if self._last_cycle_time else None,
             "last_trade": self._last_trade_time.isoformat() if self._last_trade_time else None,
             "positions": self.position_manager.get_status(),
-            "health": self.health_check(),
+            "health": self._last_health,
         }
     
     def shutdown(self) -> None:
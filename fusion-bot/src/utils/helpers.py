@@ -7,9 +7,12 @@ Common utility functions used across the application.
 
 import hashlib
 from datetime import datetime, timezone
-from typing import Optional, List
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Mapping, Pattern, Sequence
 import re
 
+import numpy as np
+
 
 def generate_news_id(title: str, source: str) -> str:
     """
@@ -27,13 +30,27 @@ def generate_news_id(title: str, source: str) -> str:
     return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
 
-def extract_symbol_from_text(text: str, supported_symbols: dict) -> Optional[str]:
+# Words and standalone symbols (e.g. "₿") in a lowercased headline
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def extract_symbol_from_text(
+    text: str,
+    supported_symbols: Mapping[str, Sequence[str]],
+    alias_index: Optional[Mapping[str, str]] = None,
+) -> Optional[str]:
     """
     Extract trading symbol from news headline.
     
+    Keywords are matched as whole words, so "sol" does not match "solution".
+    When several symbols are mentioned, the one listed first in
+    supported_symbols wins.
+    
     Args:
         text: News headline or body
         supported_symbols: Dict mapping symbols to their keywords
+        alias_index: Optional precomputed {keyword: symbol} index for
+            supported_symbols (e.g. ALIAS_TO_SYMBOL); built if omitted
     
     Returns:
         Trading symbol if found, None otherwise
@@ -43,16 +60,81 @@ def extract_symbol_from_text(text: str, supported_symbols: dict) -> Optional[str
         >>> extract_symbol_from_text("Bitcoin hits new high", supported)
         "BTC/USDC"
     """
-    text_lower = text.lower()
+    if alias_index is None:
+        alias_index = {
+            alias.lower(): symbol
+            for symbol, aliases in supported_symbols.items()
+            for alias in aliases
+        }
+    
+    found = {
+        alias_index[token]
+        for token in _TOKEN_RE.findall(text.lower())
+        if token in alias_index
+    }
+    if not found:
+        return None
     
-    for symbol, keywords in supported_symbols.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return symbol
+    for symbol in supported_symbols:
+        if symbol in found:
+            return symbol
     
     return None
 
 
+def compile_keyword_pattern(keywords: Sequence[str]) -> Pattern[str]:
+    """
+    Compile whole-word keywords into a single regex for one-pass matching.
+    
+    A leading alternation finds the positions where any keyword starts;
+    each keyword then has its own lookahead capture group at that
+    position, so keywords sharing a start (e.g. "rate" and "rate hike")
+    and overlapping ones (e.g. "interest rate" and "rate hike" in
+    "interest rate hike") are all reported.
+    
+    Args:
+        keywords: Lowercase keywords or phrases
+    
+    Returns:
+        Compiled pattern with one group per keyword, in keyword order
+    """
+    alternation = "|".join(re.escape(k) for k in keywords)
+    per_keyword = "".join(rf"(?=(?:({re.escape(k)})\b)?)" for k in keywords)
+    return re.compile(rf"(?=\b(?:{alternation})\b){per_keyword}")
+
+
+def find_keywords(
+    pattern: Pattern[str],
+    keywords: Sequence[str],
+    text: str,
+) -> List[str]:
+    """
+    Find which keywords occur in text as whole words.
+    
+    Args:
+        pattern: Pattern built by compile_keyword_pattern(keywords)
+        keywords: The keywords the pattern was built from
+        text: Text to scan (matched case-insensitively)
+    
+    Returns:
+        Matched keywords, in the order they appear in keywords
+    
+    Example:
+        >>> kws = ["rate", "rate hike", "war"]
+        >>> find_keywords(compile_keyword_pattern(kws), kws, "Fed announces rate hike")
+        ['rate', 'rate hike']
+    """
+    matched = {
+        keyword
+        for m in pattern.finditer(text.lower())
+        for keyword in m.groups()
+        if keyword
+    }
+    if not matched:
+        return []
+    return [k for k in keywords if k in matched]
+
+
 def parse_rss_date(date_string: str) -> Optional[datetime]:
     """
     Parse various RSS date formats to datetime.
@@ -66,6 +148,19 @@ def parse_rss_date(date_string: str) -> Optional[datetime]:
     if not date_string:
         return None
     
+    date_string = date_string.strip()
+    
+    # Fast paths: RFC 822 (RSS pubDate, including "GMT"/"EST" zones) and ISO 8601 (Atom)
+    try:
+        dt = parsedate_to_datetime(date_string)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(date_string)
+        except ValueError:
+            dt = None
+    if dt is not None:
+        return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+    
     # Common RSS date formats
     formats = [
         "%a, %d %b %Y %H:%M:%S %z",      # RFC 822
@@ -76,9 +171,6 @@ def parse_rss_date(date_string: str) -> Optional[datetime]:
         "%Y-%m-%d",                       # Date only
     ]
     
-    # Clean up the date string
-    date_string = date_string.strip()
-    
     # Handle timezone abbreviations
     date_string = re.sub(r'\s+(GMT|UTC|EST|PST|EDT|PDT)\s*$', '', date_string)
     
@@ -143,6 +235,29 @@ def calculate_position_size(
     return final_quantity
 
 
+def calculate_pnl_percents(
+    entry_prices: Sequence[float],
+    current_prices: Sequence[float],
+) -> np.ndarray:
+    """
+    Calculate unrealized P&L for many long positions at once.
+    
+    Args:
+        entry_prices: Entry price per position
+        current_prices: Current price per position (NaN if unknown)
+    
+    Returns:
+        Array of P&L as decimals (0.05 = 5%), NaN where price is unknown
+    
+    Example:
+        >>> calculate_pnl_percents([100.0, 50.0], [110.0, 45.0])
+        array([ 0.1, -0.1])
+    """
+    entries = np.asarray(entry_prices, dtype=np.float64)
+    currents = np.asarray(current_prices, dtype=np.float64)
+    return (currents - entries) / entries
+
+
 def format_price(price: float, decimals: int = 2) -> str:
     """
     Format price with appropriate decimal places.